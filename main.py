@@ -312,7 +312,7 @@ async def main() -> None:
         raise
     finally:
         logger.info("Stopping scheduler...")
-        scheduler.stop()
+        await scheduler.stop()
 
         if telegram_bot:
             logger.info("Stopping Telegram bot...")
@@ -322,6 +322,9 @@ async def main() -> None:
             logger.info("Stopping Feishu bot...")
             feishu_bot.stop()
 
+        if report_generator:
+            await report_generator.aclose()
+
         logger.info("Closing service client...")
         await service_client.close()
 
@@ -47,6 +47,11 @@ class ReportAgent(ToolCallAgent):
         self._report_generator = ReportGenerator(self.llm)
         self._correlation_engine = CorrelationEngine()
 
+    async def aclose(self) -> None:
+        """Release the report generator's background resources."""
+        if self._report_generator:
+            await self._report_generator.aclose()
+
     def set_data_sources(
         self,
         market_fetcher: Any = None,
@@ -12,8 +12,7 @@ from telegram.ext import ContextTypes
 from server.bot.formatter import (
     format_status,
     format_help,
-    format_news_digest_with_analysis,
-    format_news_digest_simple,
+    format_news_digest,
     format_crypto_update,
     format_market_with_watchlist,
 )
@@ -112,9 +111,7 @@ class CommandDispatcher:
 
                 # Update scheduler checkpoint for /continue to work
                 if self.scheduler and hasattr(self.scheduler, "_last_news_fetch_time"):
-                    self.scheduler._last_news_fetch_time = now
-                    self.scheduler._last_news_fetch_offset = 0
-                    self.scheduler._last_news_fetch_source = "command"
+                    self.scheduler.record_news_fetch_checkpoint(now, source="command")
 
                 # Calculate hours for fetch
                 hours_elapsed = max(0.25, (now - fetch_start).total_seconds() / 3600)
@@ -134,10 +131,7 @@ class CommandDispatcher:
                     return
 
                 # Format and send
-                if any(item.chinese_summary for item in items):
-                    message = format_news_digest_with_analysis(items, max_items=10)
-                else:
-                    message = format_news_digest_simple(items, max_items=10)
+                message = format_news_digest(items, max_items=10)
 
                 await update.message.reply_text(
                     message,
@@ -227,10 +221,7 @@ class CommandDispatcher:
         logger.info("[Step 4/4] 开始格式化消息...")
         step4_start = time.time()
 
-        if any(item.chinese_summary for item in aggregated):
-            message = format_news_digest_with_analysis(aggregated, max_items=8)
-        else:
-            message = format_news_digest_simple(aggregated, max_items=8)
+        message = format_news_digest(aggregated, max_items=8)
 
         await update.message.reply_text(
             message, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True
@@ -637,10 +628,7 @@ class CommandDispatcher:
                 return
 
             # Format and send
-            if any(item.chinese_summary for item in items):
-                message = format_news_digest_with_analysis(items, max_items=10)
-            else:
-                message = format_news_digest_simple(items, max_items=10)
+            message = format_news_digest(items, max_items=10)
 
             # Add pagination hint
             if len(items) >= 10:
@@ -8,8 +8,7 @@ from loguru import logger
 from server.bot.formatter import (
     format_status,
     format_help,
-    format_news_digest_with_analysis,
-    format_news_digest_simple,
+    format_news_digest,
     format_crypto_update,
     format_market_with_watchlist,
 )
@@ -78,9 +77,7 @@ class FeishuCommandDispatcher:
 
                 # Update scheduler checkpoint for /continue to work
                 if self.scheduler and hasattr(self.scheduler, "_last_news_fetch_time"):
-                    self.scheduler._last_news_fetch_time = now
-                    self.scheduler._last_news_fetch_offset = 0
-                    self.scheduler._last_news_fetch_source = "command"
+                    self.scheduler.record_news_fetch_checkpoint(now, source="command")
 
                 # Calculate hours for fetch
                 hours_elapsed = max(0.25, (now - fetch_start).total_seconds() / 3600)
@@ -99,10 +96,7 @@ class FeishuCommandDispatcher:
                     return "📰 暂无最新新闻"
 
                 # Format and return
-                if any(item.chinese_summary for item in items):
-                    message = format_news_digest_with_analysis(items, max_items=10)
-                else:
-                    message = format_news_digest_simple(items, max_items=10)
+                message = format_news_digest(items, max_items=10)
 
                 logger.info(f"News sent to Feishu chat {chat_id}")
                 return message
@@ -144,10 +138,7 @@ class FeishuCommandDispatcher:
                     logger.warning(f"News analysis failed: {e}")
 
             # Format and return
-            if any(item.chinese_summary for item in aggregated):
-                message = format_news_digest_with_analysis(aggregated, max_items=8)
-            else:
-                message = format_news_digest_simple(aggregated, max_items=8)
+            message = format_news_digest(aggregated, max_items=8)
 
             logger.info(f"News sent (legacy) to Feishu chat {chat_id}")
             return message
@@ -488,10 +479,7 @@ class FeishuCommandDispatcher:
                 return "📰 没有更多新闻了"
 
             # Format and return
-            if any(item.chinese_summary for item in items):
-                message = format_news_digest_with_analysis(items, max_items=10)
-            else:
-                message = format_news_digest_simple(items, max_items=10)
+            message = format_news_digest(items, max_items=10)
 
             # Add pagination hint
             if len(items) >= 10:
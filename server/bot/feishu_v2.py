@@ -15,6 +15,7 @@ from lark_oapi.api.im.v1 import (
 from loguru import logger
 
 from server.settings import global_settings
+from server.utils import BoundedSet
 
 if TYPE_CHECKING:
     from server.bot.chat import ChatManager
@@ -103,7 +104,7 @@ class FeishuBotV2:
         self._own_loop: asyncio.AbstractEventLoop | None = None
         self._ws_thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._processed_message_ids: set[str] = set()  # Dedup reconnect replays
+        self._processed_message_ids = BoundedSet(5000)  # Dedup reconnect replays
 
         # Create Lark client for sending messages
         self.client = (
@@ -214,11 +215,6 @@ class FeishuBotV2:
                 return
             if msg_id:
                 self._processed_message_ids.add(msg_id)
-                # Limit cache size
-                if len(self._processed_message_ids) > 5000:
-                    self._processed_message_ids = set(
-                        list(self._processed_message_ids)[-2500:]
-                    )
 
             chat_id = message.chat_id
             msg_type = message.message_type
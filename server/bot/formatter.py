@@ -7,11 +7,16 @@ from server.analysis.types import CorrelationResults
 from server.services.news_aggregator import NewsItem
 
 
+# Built once at import; str.translate escapes every character in a single pass
+_MD_ESCAPE_TABLE = str.maketrans({char: "\\" + char for char in "_*`[]()"})
+
+# Importance score -> title marker (scores of 4 and above share the top marker)
+_IMPORTANCE_MARKERS = {2: "🟡", 3: "🟠"}
+
+
 def escape_md(text: str) -> str:
     """Escape special Markdown characters for safe display."""
-    for char in ["_", "*", "`", "[", "]", "(", ")"]:
-        text = text.replace(char, "\\" + char)
-    return text
+    return text.translate(_MD_ESCAPE_TABLE)
 
 
 def format_source_label(source_type: str, source_name: str = "") -> str:
@@ -90,13 +95,10 @@ def format_news_digest_with_analysis(
 
     for i, item in enumerate(items, 1):
         # Title with importance indicator and source label
-        importance = ""
         if item.importance >= 4:
             importance = "🔴"
-        elif item.importance == 3:
-            importance = "🟠"
-        elif item.importance == 2:
-            importance = "🟡"
+        else:
+            importance = _IMPORTANCE_MARKERS.get(item.importance, "")
 
         # Get source label
         source_name = item.sources[0].get("name", "") if item.sources else ""
@@ -209,6 +211,17 @@ def format_news_digest_simple(
     return "\n".join(lines)
 
 
+def format_news_digest(
+    items: list[NewsItem],
+    timestamp: datetime | None = None,
+    max_items: int = 10,
+) -> str:
+    """Format news digest, choosing the analysis layout when any item has one."""
+    if any(item.chinese_summary for item in items):
+        return format_news_digest_with_analysis(items, timestamp, max_items)
+    return format_news_digest_simple(items, timestamp, max_items)
+
+
 # ============================================================================
 # Crypto Push Formats
 # ============================================================================
@@ -18,6 +18,8 @@ from lark_oapi.api.im.v1 import (
 
 from loguru import logger
 
+from server.utils import BoundedSet
+
 from .base import Channel, MessageLimit
 
 
@@ -111,7 +113,7 @@ class FeishuChannel(Channel):
         self._own_loop = None
         self._ws_thread = None
         self._loop = None
-        self._processed_message_ids = set()  # 去重重连消息
+        self._processed_message_ids = BoundedSet(5000)  # 去重重连消息
         self._enabled = bool(app_id) and bool(app_secret)
 
         # 创建 Lark 客户端（用于发送消息）
@@ -335,11 +337,6 @@ class FeishuChannel(Channel):
 
             if msg_id:
                 self._processed_message_ids.add(msg_id)
-                # 限制缓存大小
-                if len(self._processed_message_ids) > 5000:
-                    self._processed_message_ids = set(
-                        list(self._processed_message_ids)[-2500:]
-                    )
 
             chat_id = message.chat_id
             msg_type = message.message_type
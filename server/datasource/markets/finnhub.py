@@ -210,7 +210,7 @@ class FinnhubSource(BaseDataSource[MarketItem]):
         logger.info(f"Fetched {len(results)} commodity quotes")
         return results
 
-    async def fetch_all(self) -> dict[str, list]:
+    async def fetch_all(self) -> dict[str, dict | list]:
         """Fetch all market data in parallel."""
         import asyncio
 
@@ -9,6 +9,7 @@ Fetches:
 - Analyst recommendations
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -100,6 +101,7 @@ class FinnhubNewsSource:
 
     BASE_URL = "https://finnhub.io/api/v1"
     SERVICE_ID = "finnhub_news"
+    QUOTE_CONCURRENCY = 5  # Max in-flight /quote requests for bulk fetches
 
     def __init__(self, api_key: str, client: ServiceClient | None = None):
         self.api_key = api_key
@@ -364,3 +366,24 @@ class FinnhubNewsSource:
         except Exception as e:
             logger.error(f"Failed to fetch quote for {symbol}: {e}")
             return None
+
+    async def fetch_quotes_bulk(self, symbols: list[str]) -> dict[str, dict]:
+        """
+        Fetch current quotes for several symbols.
+
+        Finnhub has no multi-symbol quote endpoint, so the /quote requests are
+        issued concurrently (at most QUOTE_CONCURRENCY at a time) and go
+        through the ServiceClient cache when one is configured. Symbols
+        without a quote are left out of the result.
+        """
+        if not self.is_configured() or not symbols:
+            return {}
+
+        semaphore = asyncio.Semaphore(self.QUOTE_CONCURRENCY)
+
+        async def _fetch(symbol: str) -> dict | None:
+            async with semaphore:
+                return await self.fetch_quote(symbol)
+
+        quotes = await asyncio.gather(*(_fetch(symbol) for symbol in symbols))
+        return {symbol: quote for symbol, quote in zip(symbols, quotes) if quote}
@@ -0,0 +1,143 @@
+"""
+RSS条目解析热路径
+纯函数实现，不依赖RSSFetcher实例状态，可直接用Cython/mypyc编译为同名扩展模块，
+编译产物（_parse.*.so）会优先于本文件被导入，调用方无需改动
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from html import unescape
+from typing import Any
+
+from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from loguru import logger
+
+
+@dataclass(slots=True, kw_only=True)
+class RSSArticle:
+    """RSS文章模型（内部传输对象，不做字段校验）"""
+
+    feed_name: str
+    title: str
+    link: str
+    published: datetime
+    summary: str = ""
+    content: str | None = None
+    author: str | None = None
+    guid: str
+
+
+def _collapse_whitespace(text: str) -> str:
+    """清理多余空白"""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return "\n".join(chunk for chunk in chunks if chunk)
+
+
+def clean_html_content(html: str) -> str:
+    """清洗HTML内容，提取纯文本"""
+    if not html:
+        return ""
+
+    # 不含标签的纯文本无需构建解析树，只需解码实体
+    if "<" not in html:
+        if "&" in html:
+            html = unescape(html)
+        return _collapse_whitespace(html)
+
+    try:
+        soup = BeautifulSoup(html, "html.parser")
+
+        # 移除script和style标签
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        # 获取纯文本
+        return _collapse_whitespace(soup.get_text(separator="\n"))
+    except Exception as e:
+        logger.warning(f"Failed to clean HTML content: {e}")
+        return html
+
+
+def parse_date(date_str: str | None) -> datetime:
+    """解析日期字符串，确保返回naive datetime（无时区）"""
+    if not date_str:
+        return datetime.now()
+
+    try:
+        # 快速路径：RFC 822/2822 (pubDate) 与 ISO 8601 (updated)，都由标准库处理
+        try:
+            dt = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            try:
+                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            except ValueError:
+                # 非标准格式才回退到dateutil进行健壮的日期解析
+                dt = date_parser.parse(date_str)
+
+        # 如果有时区信息，转换为本地时间并移除时区信息
+        if dt.tzinfo is not None:
+            dt = dt.astimezone().replace(tzinfo=None)
+        return dt
+    except Exception:
+        # 如果解析失败，使用当前时间
+        return datetime.now()
+
+
+def parse_entries(entries: list[Any], feed_name: str) -> list[RSSArticle]:
+    """解析feed条目为文章模型"""
+    articles: list[RSSArticle] = []
+    append = articles.append
+    _clean = clean_html_content
+    _parse_date = parse_date
+
+    for entry in entries:
+        try:
+            # FeedParserDict的属性访问会走__getattr__映射，这里每个键只取一次
+            get = entry.get
+
+            # 提取内容
+            content_list = get("content")
+            if content_list:
+                content: str | None = content_list[0].get("value", "")
+            else:
+                content = get("description")
+
+            # 清洗HTML内容
+            if content:
+                content = _clean(content)
+
+            # 提取摘要
+            summary = get("summary")
+            summary = _clean(summary) if summary else ""
+
+            # 解析发布日期
+            published = _parse_date(get("published") or get("updated"))
+
+            # 生成唯一标识符
+            title = get("title")
+            link = get("link", "")
+            guid: str = get("id") or link
+            if not guid:
+                # 如果没有ID，使用标题+链接的组合
+                guid = f"{title or ''}_{link}"
+
+            article = RSSArticle(
+                feed_name=feed_name,
+                title=title if title is not None else "Untitled",
+                link=link,
+                published=published,
+                summary=summary[:1000],  # 限制长度
+                content=content,
+                author=get("author"),
+                guid=guid[:500],  # 限制GUID长度
+            )
+            append(article)
+
+        except Exception as e:
+            logger.warning(f"Failed to parse entry: {e}")
+            continue
+
+    return articles
@@ -11,18 +11,25 @@ from typing import Any
 
 import feedparser
 import httpx
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
 from loguru import logger
 from pydantic import BaseModel, HttpUrl
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import server.datastore.engine as db_engine
+from server.datasource.rss._parse import (
+    RSSArticle,
+    clean_html_content,
+    parse_date,
+    parse_entries,
+)
 from server.datastore.models import RSSArticleDB, RSSFeedDB
 from server.settings import global_settings
 from server.utils import safe_func_wrapper
 
+# RSS请求公共头；Accept-Encoding由httpx按已安装的解码器（gzip/br/zstd）自动协商
+RSS_REQUEST_HEADERS = {"User-Agent": "xbot-rss/1.0"}
+
 
 class RSSFeedConfig(BaseModel):
     """RSS源配置模型"""
@@ -34,31 +41,37 @@ class RSSFeedConfig(BaseModel):
     source: str = ""
 
 
-class RSSArticle(BaseModel):
-    """RSS文章模型"""
-
-    feed_name: str
-    title: str
-    link: str
-    published: datetime
-    summary: str = ""
-    content: str | None = None
-    author: str | None = None
-    guid: str
-
-
 class RSSRepository:
     """RSS数据库操作层"""
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        # 单次会话内的RSS源行缓存，避免同一抓取周期重复查询
+        self._feed_cache: dict[str, RSSFeedDB] = {}
+
+    async def preload_feeds(self, names: list[str]) -> None:
+        """一次查询预加载多个RSS源到缓存"""
+        if not names:
+            return
+        result = await self.session.execute(
+            select(RSSFeedDB).where(RSSFeedDB.name.in_(names))
+        )
+        for feed_db in result.scalars():
+            self._feed_cache[feed_db.name] = feed_db
 
     async def get_feed_by_name(self, name: str) -> RSSFeedDB | None:
         """根据名称获取RSS源"""
+        feed_db = self._feed_cache.get(name)
+        if feed_db is not None:
+            return feed_db
+
         result = await self.session.execute(
             select(RSSFeedDB).where(RSSFeedDB.name == name)
         )
-        return result.scalar_one_or_none()
+        feed_db = result.scalar_one_or_none()
+        if feed_db is not None:
+            self._feed_cache[name] = feed_db
+        return feed_db
 
     async def create_or_update_feed(self, feed_config: RSSFeedConfig) -> RSSFeedDB:
         """创建或更新RSS源"""
@@ -83,6 +96,7 @@ class RSSRepository:
             self.session.add(feed_db)
 
         await self.session.flush()
+        self._feed_cache[feed_config.name] = feed_db
         return feed_db
 
     async def update_feed_fetch_time(self, feed_name: str) -> None:
@@ -100,39 +114,45 @@ class RSSRepository:
 
     async def article_exists(self, guid: str) -> bool:
         """检查文章是否已存在（去重）"""
+        # 只查唯一索引，不加载文章正文
         result = await self.session.execute(
-            select(RSSArticleDB).where(RSSArticleDB.guid == guid)
+            select(exists().where(RSSArticleDB.guid == guid))
         )
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
 
     async def save_articles(self, articles: list[RSSArticle]) -> int:
-        """批量保存文章（自动去重）"""
-        saved_count = 0
-
-        for article in articles:
-            # 检查是否已存在
-            if await self.article_exists(article.guid):
-                logger.debug(f"Article already exists: {article.title[:50]}")
-                continue
-
-            # 创建新文章记录
-            article_db = RSSArticleDB(
-                feed_name=article.feed_name,
-                guid=article.guid,
-                title=article.title,
-                link=article.link,
-                published=article.published,
-                summary=article.summary,
-                content=article.content,
-                author=article.author,
+        """批量保存文章（按guid在数据库侧去重）"""
+        if not articles:
+            return 0
+
+        # 整批共用一个抓取时间，避免列默认值datetime.now逐行调用
+        fetched_at = datetime.now()
+        insert = db_engine.dialect_insert(self.session)
+        stmt = (
+            insert(RSSArticleDB)
+            .values(
+                [
+                    {
+                        "feed_name": article.feed_name,
+                        "guid": article.guid,
+                        "title": article.title,
+                        "link": article.link,
+                        "published": article.published,
+                        "summary": article.summary,
+                        "content": article.content,
+                        "author": article.author,
+                        "fetched_at": fetched_at,
+                    }
+                    for article in articles
+                ]
             )
-            self.session.add(article_db)
-            saved_count += 1
-
-        if saved_count > 0:
-            await self.session.flush()
+            .on_conflict_do_nothing(index_elements=[RSSArticleDB.guid])
+            .returning(RSSArticleDB.id)
+        )
+        result = await self.session.execute(stmt)
 
-        return saved_count
+        # RETURNING只返回实际插入的行，已存在的guid被跳过
+        return len(result.scalars().all())
 
 
 class RSSFetcher:
@@ -143,164 +163,92 @@ class RSSFetcher:
             config_path = global_settings.rss_config_path
         self.config_path = Path(config_path)
         self.feeds: list[RSSFeedConfig] = []
+        # 配置文件的mtime，未变化时跳过重新解析
+        self._config_mtime_ns: int | None = None
         self._load_config()
 
     def _load_config(self) -> None:
-        """加载RSS配置"""
+        """加载RSS配置（文件未修改时直接复用已解析的配置）"""
         try:
             if not self.config_path.exists():
                 logger.warning(f"Config file not found: {self.config_path}")
                 self.feeds = []
+                self._config_mtime_ns = None
+                return
+
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            if mtime_ns == self._config_mtime_ns:
                 return
 
-            with open(self.config_path) as f:
-                data = json.load(f)
-                rss_list = data.get("rss", [])
+            data = json.loads(self.config_path.read_bytes())
+            rss_list = data.get("rss", [])
 
-                # 过滤掉空配置
-                valid_rss = [
-                    rss for rss in rss_list if rss.get("name") and rss.get("url")
-                ]
-                self.feeds = [RSSFeedConfig(**feed) for feed in valid_rss]
+            # 过滤掉空配置
+            valid_rss = [rss for rss in rss_list if rss.get("name") and rss.get("url")]
+            self.feeds = [RSSFeedConfig(**feed) for feed in valid_rss]
+            self._config_mtime_ns = mtime_ns
 
             logger.info(f"Loaded {len(self.feeds)} RSS feeds from config")
         except Exception as e:
+            # 保留上一次成功加载的配置
             logger.error(f"Failed to load RSS config: {e}")
-            self.feeds = []
-
-    @staticmethod
-    def clean_html_content(html: str) -> str:
-        """清洗HTML内容，提取纯文本"""
-        if not html:
-            return ""
-
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # 移除script和style标签
-            for script in soup(["script", "style"]):
-                script.decompose()
-
-            # 获取纯文本
-            text = soup.get_text(separator="\n")
-
-            # 清理多余空白
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = "\n".join(chunk for chunk in chunks if chunk)
-
-            return text
-        except Exception as e:
-            logger.warning(f"Failed to clean HTML content: {e}")
-            return html
-
-    @staticmethod
-    def parse_date(date_str: str | None) -> datetime:
-        """解析日期字符串，确保返回naive datetime（无时区）"""
-        if not date_str:
-            return datetime.now()
 
-        try:
-            # 使用dateutil进行健壮的日期解析
-            dt = date_parser.parse(date_str)
-            # 如果有时区信息，转换为UTC并移除时区信息
-            if dt.tzinfo is not None:
-                dt = dt.astimezone().replace(tzinfo=None)
-            return dt
-        except Exception:
-            # 如果解析失败，使用当前时间
-            return datetime.now()
+    # 解析热路径实现在 _parse 模块中（可编译为扩展模块）
+    clean_html_content = staticmethod(clean_html_content)
+    parse_date = staticmethod(parse_date)
 
     def _parse_entries(self, entries: list[Any], feed_name: str) -> list[RSSArticle]:
         """解析feed条目为文章模型"""
-        articles = []
-
-        for entry in entries:
-            try:
-                # 提取内容
-                content = None
-                if hasattr(entry, "content") and entry.content:
-                    content = entry.content[0].get("value", "")
-                elif hasattr(entry, "description"):
-                    content = entry.description
-
-                # 清洗HTML内容
-                if content:
-                    content = self.clean_html_content(content)
-
-                # 提取摘要
-                summary = ""
-                if hasattr(entry, "summary"):
-                    summary = self.clean_html_content(entry.summary)
-
-                # 解析发布日期
-                published_str = getattr(entry, "published", None) or getattr(
-                    entry, "updated", None
-                )
-                published = self.parse_date(published_str)
-
-                # 生成唯一标识符
-                guid = getattr(entry, "id", None) or getattr(entry, "link", "")
-                if not guid:
-                    # 如果没有ID，使用标题+链接的组合
-                    guid = f"{entry.get('title', '')}_{entry.get('link', '')}"
-
-                article = RSSArticle(
-                    feed_name=feed_name,
-                    title=entry.get("title", "Untitled"),
-                    link=entry.get("link", ""),
-                    published=published,
-                    summary=summary[:1000] if summary else "",  # 限制长度
-                    content=content,
-                    author=entry.get("author", None),
-                    guid=guid[:500],  # 限制GUID长度
-                )
-                articles.append(article)
-
-            except Exception as e:
-                logger.warning(f"Failed to parse entry: {e}")
-                continue
-
-        return articles
+        return parse_entries(entries, feed_name)
 
     @safe_func_wrapper
     async def fetch_feed_with_retry(
-        self, feed: RSSFeedConfig, session: AsyncSession
+        self, feed: RSSFeedConfig, repo: RSSRepository, client: httpx.AsyncClient
     ) -> list[RSSArticle]:
         """带重试机制的RSS获取"""
         max_retries = global_settings.rss_max_retries
-        timeout = global_settings.rss_request_timeout
+
+        # 条件请求：携带上次响应的缓存校验值，未变化的源直接返回304
+        feed_db = await repo.get_feed_by_name(feed.name)
+        headers: dict[str, str] = {}
+        if feed_db is not None:
+            if feed_db.etag:
+                headers["If-None-Match"] = feed_db.etag
+            if feed_db.last_modified:
+                headers["If-Modified-Since"] = feed_db.last_modified
 
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    logger.info(
-                        f"Fetching RSS feed: {feed.name} (attempt {attempt + 1}/{max_retries})"
-                    )
+                logger.info(
+                    f"Fetching RSS feed: {feed.name} (attempt {attempt + 1}/{max_retries})"
+                )
 
-                    response = await client.get(str(feed.url))
-                    response.raise_for_status()
+                response = await client.get(str(feed.url), headers=headers)
+                if response.status_code == 304:
+                    logger.info(f"Feed not modified: {feed.name}")
+                    return []
+                response.raise_for_status()
 
-                    # 解析feed
-                    parsed = feedparser.parse(response.content)
+                # 解析feed
+                parsed = feedparser.parse(response.content)
 
-                    # 检查是否解析成功
-                    if parsed.bozo:
-                        logger.warning(
-                            f"Feed parsing warning for {feed.name}: {parsed.bozo_exception}"
-                        )
+                # 检查是否解析成功
+                if parsed.bozo:
+                    logger.warning(
+                        f"Feed parsing warning for {feed.name}: {parsed.bozo_exception}"
+                    )
 
-                    articles = self._parse_entries(parsed.entries, feed.name)
+                articles = self._parse_entries(parsed.entries, feed.name)
 
-                    # 过滤新文章（增量更新）
-                    articles = await self._filter_new_articles(
-                        articles, feed.name, session
-                    )
+                # 解析成功后才记录新的校验值，避免重试时误判为未修改
+                if feed_db is not None:
+                    feed_db.etag = response.headers.get("ETag")
+                    feed_db.last_modified = response.headers.get("Last-Modified")
 
-                    logger.info(
-                        f"Successfully fetched {len(articles)} new articles from {feed.name}"
-                    )
-                    return articles
+                logger.info(
+                    f"Successfully fetched {len(articles)} articles from {feed.name}"
+                )
+                return articles
 
             except httpx.TimeoutException:
                 logger.warning(
@@ -324,32 +272,14 @@ class RSSFetcher:
         logger.error(f"Failed to fetch {feed.name} after {max_retries} attempts")
         return []
 
-    async def _filter_new_articles(
-        self, articles: list[RSSArticle], feed_name: str, session: AsyncSession
-    ) -> list[RSSArticle]:
-        """过滤新文章（增量更新）"""
-        repo = RSSRepository(session)
-        last_fetch = await repo.get_last_fetch_time(feed_name)
-
-        if last_fetch is None:
-            # 首次抓取，返回所有文章
-            return articles
-
-        # 只返回上次抓取之后发布的文章
-        new_articles = [
-            article for article in articles if article.published > last_fetch
-        ]
-
-        logger.info(
-            f"Filtered {len(articles)} articles to {len(new_articles)} new ones for {feed_name}"
-        )
-        return new_articles
-
     async def fetch_all_feeds(self) -> dict[str, int]:
         """
         并发获取所有RSS源并保存到数据库
         返回每个源保存的文章数量
         """
+        # 配置文件被外部修改时自动重新加载
+        self._load_config()
+
         if not self.feeds:
             logger.warning("No RSS feeds configured")
             return {}
@@ -359,15 +289,23 @@ class RSSFetcher:
 
         async with db_engine.AsyncSessionLocal() as session:
             repo = RSSRepository(session)
+            await repo.preload_feeds([feed.name for feed in self.feeds])
 
             # 创建或更新所有feed配置
             for feed in self.feeds:
                 await repo.create_or_update_feed(feed)
             await session.commit()
 
-            # 并发获取所有RSS源
-            tasks = [self.fetch_feed_with_retry(feed, session) for feed in self.feeds]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # 并发获取所有RSS源（共享同一个HTTP客户端以复用连接）
+            async with httpx.AsyncClient(
+                timeout=global_settings.rss_request_timeout,
+                headers=RSS_REQUEST_HEADERS,
+            ) as client:
+                tasks = [
+                    self.fetch_feed_with_retry(feed, repo, client)
+                    for feed in self.feeds
+                ]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # 处理结果并保存到数据库
             feed_stats = {}
@@ -396,7 +334,9 @@ class RSSFetcher:
     async def validate_feed(self, url: str) -> tuple[bool, str, list[dict]]:
         """Validate an RSS feed URL. Returns (ok, feed_title, latest_5_entries)."""
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
+            async with httpx.AsyncClient(
+                timeout=15, headers=RSS_REQUEST_HEADERS
+            ) as client:
                 response = await client.get(url)
                 response.raise_for_status()
 
@@ -473,6 +413,7 @@ class RSSFetcher:
             }
             with open(self.config_path, "w") as fp:
                 json.dump(data, fp, indent=2, ensure_ascii=False)
+            self._config_mtime_ns = self.config_path.stat().st_mtime_ns
             logger.info(f"Saved {len(self.feeds)} feeds to config")
         except Exception as e:
             logger.error(f"Failed to save RSS config: {e}")
@@ -7,20 +7,44 @@ task claiming to prevent duplicate executions.
 """
 
 import asyncio
+import heapq
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
-
+from sqlalchemy import select
+
+from server.bot.formatter import (
+    format_crypto_update,
+    format_earnings_alert,
+    format_evening_briefing,
+    format_insider_alert,
+    format_market_anomaly_alert,
+    format_morning_briefing,
+    format_news_digest,
+)
+from server.datastore.models import RSSArticleDB
+from server.datastore.repositories import AlertClaimRepository
+from server.reports.generator import ReportDataContext, ReportGenerator
+from server.services.news_aggregator import (
+    NewsAggregator,
+    NewsAnalyzer,
+    published_sort_key,
+)
+from server.services.rate_limiter import AsyncTokenBucket
 from server.settings import global_settings
+from server.utils import BloomFilter, BoundedSet
 
 if TYPE_CHECKING:
     from server.bot.telegram import TelegramBot
     from server.bot.feishu_v2 import FeishuBotV2
     from server.analysis.correlation import CorrelationEngine
-    from server.reports.generator import ReportGenerator
     from server.services.news_processor import NewsProcessor
     from server.datasource.source_manager import SourceManager
     from server.datasource.rss.rss import RSSFetcher
@@ -41,11 +65,14 @@ FINNHUB_NEWS_INTERVAL_MINUTES = 15
 INSIDER_ALERT_INTERVAL_MINUTES = 30
 EARNINGS_ALERT_INTERVAL_HOURS = 6
 MARKET_ANOMALY_INTERVAL_MINUTES = 5
+SCHEDULER_MISFIRE_GRACE_SECONDS = 60
 
 # Time windows for briefings (in hours)
 MORNING_BRIEFING_HOUR = 8
 EVENING_BRIEFING_HOUR = 20
 BRIEFING_TIME_WINDOW_HOURS = 12
+BRIEFING_MIN_IMPORTANCE = 3
+BRIEFING_MAX_ITEMS = 5
 
 # Import thresholds for alerts
 INSIDER_PURCHASE_THRESHOLD_USD = 100000
@@ -53,20 +80,40 @@ INSIDER_SALE_THRESHOLD_USD = 500000
 MARKET_ANOMALY_DAILY_THRESHOLD_PCT = 5.0
 MARKET_ANOMALY_INTRADAY_THRESHOLD_PCT = 3.0
 
-# Cache limits
+# Cache limits (oldest entries are evicted first)
 PUSHED_NEWS_CACHE_LIMIT = 1000
-PUSHED_NEWS_CACHE_RETAIN = 500
 PUSHED_FINNHUB_CACHE_LIMIT = 500
-PUSHED_FINNHUB_CACHE_RETAIN = 250
 ALERTED_INSIDER_CACHE_LIMIT = 500
-ALERTED_INSIDER_CACHE_RETAIN = 250
 ALERTED_EARNINGS_CACHE_LIMIT = 200
-ALERTED_EARNINGS_CACHE_RETAIN = 100
+
+# Persisted push dedup filter (survives restarts, ~1% false positives)
+PUSH_DEDUP_FILTER_CAPACITY = 20000
+PUSH_DEDUP_PERSIST_INTERVAL_MINUTES = 1
+
+# Alert IDs shared with other scheduler processes via the alert claims table
+SHARED_ALERT_DEDUP_HOURS = 7 * 24
+
+# Push queue
+PUSH_QUEUE_MAXSIZE = 500
+PUSH_QUEUE_DRAIN_TIMEOUT_SECONDS = 30  # How long stop() waits for queued pushes
+
+# Called with whether a queued push reached at least one platform
+PushCallback = Callable[[bool], Awaitable[None]]
+
+# Telegram send pacing (token bucket) to stay clear of flood-control 429s
+TELEGRAM_PUSH_RATE_PER_SECOND = 1.0
+TELEGRAM_PUSH_BURST = 5
 
 # Fetch limits
 WATCHLIST_SYMBOLS_FETCH_LIMIT = 8
+WATCHLIST_FETCH_CONCURRENCY = 5  # Max in-flight per-symbol Finnhub requests
 WATCHLIST_COMPANY_NEWS_LIMIT = 3
 WATCHLIST_COMPANY_NEWS_ITEMS = 5
+RSS_QUERY_YIELD_PER = 50  # Rows per chunk when streaming recent RSS articles
+RSS_RECENT_NEWS_LIMIT = 200  # Newest RSS articles returned per recent-news call
+RSS_WINDOW_HOURS = BRIEFING_TIME_WINDOW_HOURS  # Longest window served from memory
+# Each window refresh re-reads this far back so rows committed out of order still land
+RSS_WINDOW_REFRESH_OVERLAP = timedelta(minutes=5)
 
 
 # ============================================================================
@@ -115,7 +162,14 @@ class DataScheduler:
     """
 
     def __init__(self) -> None:
-        self.scheduler = AsyncIOScheduler()
+        self.scheduler = AsyncIOScheduler(
+            job_defaults={
+                # Collapse a backlog of missed runs into one and tolerate
+                # short event-loop stalls instead of skipping the run
+                "coalesce": True,
+                "misfire_grace_time": SCHEDULER_MISFIRE_GRACE_SECONDS,
+            }
+        )
         self._is_running = False
 
         # Data source instances (injected after init)
@@ -124,16 +178,20 @@ class DataScheduler:
         self._market_source: "FinnhubSource | None" = None
         self._economic_source: "FREDSource | None" = None
         self._finnhub_news: "FinnhubNewsSource | None" = None
+        self._finnhub_enabled = False  # Finnhub injected and configured
 
         # Push notification dependencies
         self._telegram_bot: "TelegramBot | None" = None
         self._feishu_bot: "FeishuBotV2 | None" = None
+        self._has_push_bot = False  # Any push bot injected
         self._correlation_engine: "CorrelationEngine | None" = None
         self._report_generator: "ReportGenerator | None" = None
         self._db_session_factory: Any = None
 
         # Latest fetched data (in-memory cache)
         self.latest_market_data: dict[str, dict | list] = {}
+        self._market_data_version = 0  # Bumped on every market refresh
+        self._market_summary_cache: tuple[int, str] | None = None
         self.latest_economic_data: dict[str, dict | None] = {}
         self.latest_crypto_data: list[dict] = []
         self._previous_crypto_data: list[dict] = []  # For comparison
@@ -150,22 +208,50 @@ class DataScheduler:
         self._news_analyzer: Any = None
         self._latest_finnhub_news: list[Any] = []
 
+        # Sliding window of the newest RSS rows (oldest fetched_at first), topped
+        # up with only recent rows instead of re-querying the whole range
+        self._rss_window: deque[tuple[int, datetime, dict]] = deque()
+        self._rss_window_ids: set[int] = set()
+        self._rss_window_lock = asyncio.Lock()
+
         # Push state (legacy, maintained for compatibility)
         self._last_news_push: datetime | None = None
         self._last_crypto_push: datetime | None = None
 
         # News fetch state for pagination/continue functionality
         self._last_news_fetch_time: datetime | None = None  # Last fetch checkpoint
+        self._last_news_fetch_monotonic: float | None = None  # Same, for durations
         self._last_news_fetch_offset: int = 0  # Offset for pagination
         self._last_news_fetch_source: str = ""  # "scheduled" or "command" or "continue"
 
         # Pushed news and alerts tracking (for deduplication)
-        self._pushed_news_ids: set[str] = set()
-        self._pushed_finnhub_ids: set[str] = set()
-        self._alerted_insider_ids: set[str] = set()
-        self._alerted_earnings: set[str] = set()
+        self._pushed_news_ids = BoundedSet(PUSHED_NEWS_CACHE_LIMIT)
+        self._pushed_finnhub_ids = BoundedSet(PUSHED_FINNHUB_CACHE_LIMIT)
+        self._alerted_insider_ids = BoundedSet(ALERTED_INSIDER_CACHE_LIMIT)
+        self._alerted_earnings = BoundedSet(ALERTED_EARNINGS_CACHE_LIMIT)
+        self._dedup_sets: dict[str, BoundedSet] = {
+            "news": self._pushed_news_ids,
+            "finnhub": self._pushed_finnhub_ids,
+            "insider": self._alerted_insider_ids,
+            "earnings": self._alerted_earnings,
+        }
+        # On-disk mirror of the sets above so a restart doesn't re-push; it
+        # always holds every ID in the sets, so a miss here is definitive
+        self._push_dedup_filter = BloomFilter(PUSH_DEDUP_FILTER_CAPACITY)
+        self._push_dedup_dirty = False
         self._previous_watchlist_prices: dict[str, float] = {}
 
+        # Broadcast pushes are queued and sent by a background worker so that
+        # slow bot APIs don't hold up the scheduler jobs
+        self._push_queue: asyncio.Queue[tuple[str, PushCallback | None]] = (
+            asyncio.Queue(maxsize=PUSH_QUEUE_MAXSIZE)
+        )
+        self._push_worker_task: asyncio.Task | None = None
+        self._news_digest_lock = asyncio.Lock()
+        self._telegram_bucket = AsyncTokenBucket(
+            rate=TELEGRAM_PUSH_RATE_PER_SECOND, capacity=TELEGRAM_PUSH_BURST
+        )
+
     # -------------------------------------------------------------------------
     # Dependency Injection
     # -------------------------------------------------------------------------
@@ -184,6 +270,8 @@ class DataScheduler:
         self._market_source = market_source
         self._economic_source = economic_source
         self._finnhub_news = finnhub_news
+        # Configuration doesn't change at runtime, so evaluate it once
+        self._finnhub_enabled = bool(finnhub_news and finnhub_news.is_configured())
 
     def set_push_dependencies(
         self,
@@ -196,13 +284,12 @@ class DataScheduler:
         """Inject push notification dependencies."""
         self._telegram_bot = telegram_bot
         self._feishu_bot = feishu_bot
+        self._has_push_bot = telegram_bot is not None or feishu_bot is not None
         self._correlation_engine = correlation_engine
         self._report_generator = report_generator
         self._db_session_factory = db_session_factory
 
         # Initialize news aggregator and analyzer
-        from server.services.news_aggregator import NewsAggregator, NewsAnalyzer
-
         self._news_aggregator = NewsAggregator(similarity_threshold=0.5)
         if report_generator:
             self._news_analyzer = NewsAnalyzer(llm=report_generator.llm)
@@ -216,29 +303,79 @@ class DataScheduler:
         self._news_processor = news_processor
         self._source_manager = source_manager
 
-    @property
-    def _has_push_bot(self) -> bool:
-        """Check if any push bot is configured."""
-        return self._telegram_bot is not None or self._feishu_bot is not None
-
-    async def _push_message(self, message: str) -> None:
-        """Send a push notification to all configured bots."""
-        if self._telegram_bot:
+    async def _push_message(
+        self, message: str, on_result: PushCallback | None = None
+    ) -> None:
+        """
+        Queue a push notification for all configured bots.
+
+        on_result runs once delivery has been attempted, so callers can record
+        what was pushed only after it actually went out.
+        """
+        if self._push_worker_task is None or self._push_worker_task.done():
+            # Worker not running (scheduler not started): send inline
+            await self._deliver(message, on_result)
+            return
+        try:
+            self._push_queue.put_nowait((message, on_result))
+        except asyncio.QueueFull:
+            # Backpressure on the calling job rather than losing the message
+            logger.warning("Push queue is full, sending inline")
+            await self._deliver(message, on_result)
+
+    async def _push_worker(self) -> None:
+        """Background worker that delivers queued push notifications."""
+        while True:
+            message, on_result = await self._push_queue.get()
             try:
-                await self._telegram_bot.send_to_admin(message)
+                await self._deliver(message, on_result)
             except Exception as e:
-                logger.error(f"Telegram push failed: {e}")
+                logger.error(f"Push worker failed to deliver message: {e}")
+            finally:
+                self._push_queue.task_done()
+
+    async def _deliver(self, message: str, on_result: PushCallback | None) -> None:
+        """Send a message to all bots and report the outcome to on_result."""
+        sent = await self._send_to_all(message)
+        if on_result:
+            await on_result(sent)
+
+    async def _send_to_all(self, message: str) -> bool:
+        """
+        Send a push notification to all configured bots concurrently.
+
+        Returns True if at least one platform accepted the message.
+        """
+        names: list[str] = []
+        tasks = []
+        if self._telegram_bot:
+            names.append("Telegram")
+            tasks.append(self._send_telegram(message))
         if self._feishu_bot:
-            try:
-                await self._feishu_bot.send_to_admin(message)
-            except Exception as e:
-                logger.error(f"Feishu push failed: {e}")
+            names.append("Feishu")
+            tasks.append(self._feishu_bot.send_to_admin(message))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        sent = False
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"{name} push failed: {result}")
+            else:
+                sent = True
+        return sent
+
+    async def _send_telegram(self, message: str) -> None:
+        """Send to the Telegram admin chat, paced by the token bucket."""
+        if not self._telegram_bot:
+            return
+        await self._telegram_bucket.acquire()
+        await self._telegram_bot.send_to_admin(message)
 
     async def _push_to_platform(self, platform: str, message: str) -> bool:
         """Send a push notification to a specific platform."""
         if platform == "telegram" and self._telegram_bot:
             try:
-                await self._telegram_bot.send_to_admin(message)
+                await self._send_telegram(message)
                 return True
             except Exception as e:
                 logger.error(f"Telegram push failed: {e}")
@@ -252,6 +389,41 @@ class DataScheduler:
                 return False
         return False
 
+    def _push_platforms(self) -> list[str]:
+        """Names of the platforms that have a push bot configured."""
+        platforms = []
+        if self._telegram_bot:
+            platforms.append("telegram")
+        if self._feishu_bot:
+            platforms.append("feishu")
+        return platforms
+
+    async def _push_and_mark(
+        self, platform: str, message: str, items: list, push_type: str, label: str
+    ) -> None:
+        """Push a message to one platform and record the items as pushed there."""
+        if not self._news_processor:
+            return
+        try:
+            await self._push_to_platform(platform, message)
+            await self._news_processor.mark_as_pushed(
+                items, push_type=push_type, platform=platform
+            )
+            logger.info(f"[{platform.title()}] {label} pushed: {len(items)} items")
+        except Exception as e:
+            logger.error(f"{platform.title()} {label.lower()} push failed: {e}")
+
+    async def _push_and_mark_all(
+        self, message: str, items: list, push_type: str, label: str
+    ) -> None:
+        """Push the same message to every configured platform concurrently."""
+        await asyncio.gather(
+            *(
+                self._push_and_mark(platform, message, items, push_type, label)
+                for platform in self._push_platforms()
+            )
+        )
+
     # -------------------------------------------------------------------------
     # Data Fetch Jobs
     # -------------------------------------------------------------------------
@@ -272,23 +444,25 @@ class DataScheduler:
         if not self._crypto_source:
             return
         try:
-            # Save previous data for comparison
-            if self.latest_crypto_data:
-                self._previous_crypto_data = self.latest_crypto_data.copy()
-
             prices = await self._crypto_source.fetch()
             # Store raw data and convert to dicts
             self._raw_crypto_data = prices
-            self.latest_crypto_data = []
+            crypto_data: list[dict] = []
             for p in prices:
                 if hasattr(p, "model_dump"):
-                    self.latest_crypto_data.append(p.model_dump())
+                    crypto_data.append(p.model_dump())
                 else:
                     # Handle both dict-like objects and raw dicts
                     p_dict: dict[str, Any] = (
                         dict(p) if hasattr(p, "items") else p  # type: ignore[arg-type]
                     )
-                    self.latest_crypto_data.append(p_dict)
+                    crypto_data.append(p_dict)
+
+            # Keep previous data for comparison; the list is replaced, never
+            # mutated, so swapping references is enough
+            if self.latest_crypto_data:
+                self._previous_crypto_data = self.latest_crypto_data
+            self.latest_crypto_data = crypto_data
             logger.info(f"Crypto fetch: {len(prices)} prices updated")
         except Exception as e:
             logger.error(f"Crypto fetch failed: {e}")
@@ -298,8 +472,9 @@ class DataScheduler:
         if not self._market_source:
             return
         try:
-            data = await self._market_source.fetch_all()
-            self.latest_market_data.update(data)
+            # fetch_all returns a full snapshot, so swap it in whole
+            self.latest_market_data = await self._market_source.fetch_all()
+            self._market_data_version += 1
             logger.info("Market data updated")
         except Exception as e:
             logger.error(f"Market fetch failed: {e}")
@@ -326,91 +501,71 @@ class DataScheduler:
         if not self._has_push_bot or not self._db_session_factory:
             return
 
-        try:
-            # Use unified news processor if available
-            if self._news_processor:
-                from server.bot.formatter import (
-                    format_news_digest_with_analysis,
-                    format_news_digest_simple,
-                )
-
-                # Calculate fetch start time
-                now = datetime.utcnow()
-                if self._last_news_fetch_time is None:
-                    # First push: fetch news from 15 minutes ago
-                    fetch_start = now - timedelta(minutes=NEWS_DIGEST_INTERVAL_MINUTES)
-                    logger.info(
-                        f"[Scheduled Push] First push, fetching from 15 min ago: {fetch_start}"
-                    )
-                else:
-                    # Subsequent pushes: fetch from last checkpoint
-                    fetch_start = self._last_news_fetch_time
-                    elapsed = (now - fetch_start).total_seconds() / 60
-                    logger.info(
-                        f"[Scheduled Push] Fetching from last checkpoint {elapsed:.1f} min ago"
-                    )
-
-                # Update checkpoint to current time for next iteration
-                self._last_news_fetch_time = now
-                self._last_news_fetch_offset = 0  # Reset offset for pagination
-                self._last_news_fetch_source = "scheduled"
+        # Serialize overlapping runs (scheduled and manual) instead of dropping them
+        async with self._news_digest_lock:
+            try:
+                # Use unified news processor if available
+                if self._news_processor:
+                    # Calculate fetch start time
+                    now = datetime.utcnow()
+                    if self._last_news_fetch_monotonic is None:
+                        # First push: fetch news from 15 minutes ago
+                        fetch_start = now - timedelta(
+                            minutes=NEWS_DIGEST_INTERVAL_MINUTES
+                        )
+                        logger.info(
+                            f"[Scheduled Push] First push, fetching from 15 min ago: {fetch_start}"
+                        )
+                    else:
+                        # Subsequent pushes: fetch from last checkpoint. The gap is
+                        # measured on the monotonic clock so a wall-clock step
+                        # (NTP) can't stretch the window into a huge backfill
+                        elapsed = time.monotonic() - self._last_news_fetch_monotonic
+                        fetch_start = now - timedelta(seconds=elapsed)
+                        logger.info(
+                            f"[Scheduled Push] Fetching from last checkpoint {elapsed / 60:.1f} min ago"
+                        )
 
-                # Calculate hours for _fetch_recent_news (unused but needed for interface)
-                hours_elapsed = max(0.25, (now - fetch_start).total_seconds() / 3600)
+                    # Update checkpoint to current time for next iteration
+                    self.record_news_fetch_checkpoint(now, source="scheduled")
 
-                # Push to each platform with separate deduplication
-                for platform in ("telegram", "feishu"):
-                    bot = (
-                        self._telegram_bot
-                        if platform == "telegram"
-                        else self._feishu_bot
+                    # Calculate hours for _fetch_recent_news (unused but needed for interface)
+                    hours_elapsed = max(
+                        0.25, (now - fetch_start).total_seconds() / 3600
                     )
-                    if not bot:
-                        continue
 
+                    # Time-based fetch without push-log filtering yields the same
+                    # items for every platform, so process once and fan out
                     items = await self._news_processor.get_and_process_news(
                         hours=hours_elapsed,
                         max_items=10,
                         filter_pushed=False,  # Don't filter by push log, we use time-based fetch
                         push_type="scheduled",
                         use_cache=True,
-                        platform=platform,
                         fetch_start_time=fetch_start,
                     )
 
                     if items:
-                        if any(item.chinese_summary for item in items):
-                            message = format_news_digest_with_analysis(
-                                items, max_items=10
-                            )
-                        else:
-                            message = format_news_digest_simple(items, max_items=10)
-
-                        try:
-                            await self._push_to_platform(platform, message)
-                            await self._news_processor.mark_as_pushed(
-                                items, push_type="scheduled", platform=platform
-                            )
-                            logger.info(
-                                f"[{platform.title()}] Scheduled push: {len(items)} items"
-                            )
-                        except Exception as e:
-                            logger.error(f"{platform.title()} digest push failed: {e}")
-
-                self._last_news_push = now
-            else:
-                # Legacy fallback
-                await self._news_digest_push_job_legacy()
+                        message = format_news_digest(items, max_items=10)
 
-        except Exception as e:
-            logger.error(f"News digest push failed: {e}")
+                        await self._push_and_mark_all(
+                            message,
+                            items,
+                            push_type="scheduled",
+                            label="Scheduled push",
+                        )
+
+                    self._last_news_push = now
+                else:
+                    # Legacy fallback
+                    await self._news_digest_push_job_legacy()
+
+            except Exception as e:
+                logger.error(f"News digest push failed: {e}")
 
     async def _news_digest_push_job_legacy(self) -> None:
         """Legacy news digest push (fallback when NewsProcessor not available)."""
-        from server.bot.formatter import (
-            format_news_digest_with_analysis,
-            format_news_digest_simple,
-        )
+        now = datetime.utcnow()
 
         # Get recent news (last 10 minutes to catch new items)
         news_items = await self._get_recent_news(hours=0.17)  # ~10 min
@@ -418,7 +573,9 @@ class DataScheduler:
         # Merge Finnhub news into the mix
         if self._latest_finnhub_news:
             for fn in self._latest_finnhub_news:
-                if fn.news_id not in self._pushed_finnhub_ids:
+                if not self._is_deduped(
+                    self._pushed_finnhub_ids, "finnhub", fn.news_id
+                ):
                     news_items.append(
                         {
                             "title": fn.headline,
@@ -440,7 +597,9 @@ class DataScheduler:
 
         # Filter out already pushed news
         new_items = [
-            item for item in aggregated if item.id not in self._pushed_news_ids
+            item
+            for item in aggregated
+            if not self._is_deduped(self._pushed_news_ids, "news", item.id)
         ]
 
         # If no new items, skip silently
@@ -457,34 +616,23 @@ class DataScheduler:
                 logger.warning(f"News analysis failed: {e}")
 
         # Format and send
-        if any(item.chinese_summary for item in new_items):
-            message = format_news_digest_with_analysis(new_items, max_items=5)
-        else:
-            message = format_news_digest_simple(new_items, max_items=5)
+        message = format_news_digest(new_items, max_items=5)
+
+        async def mark_pushed(sent: bool) -> None:
+            if not sent:
+                return
+            for item in new_items:
+                self._mark_deduped(self._pushed_news_ids, "news", item.id)
+                # Also mark Finnhub IDs
+                for src in item.sources:
+                    if "finnhub_id" in src:
+                        self._mark_deduped(
+                            self._pushed_finnhub_ids, "finnhub", src["finnhub_id"]
+                        )
 
-        await self._push_message(message)
+        await self._push_message(message, on_result=mark_pushed)
 
-        # Mark as pushed
-        for item in new_items:
-            self._pushed_news_ids.add(item.id)
-            # Also mark Finnhub IDs
-            for src in item.sources:
-                if "finnhub_id" in src:
-                    self._pushed_finnhub_ids.add(src["finnhub_id"])
-
-        # Limit cache size
-        self._trim_cache(
-            self._pushed_news_ids,
-            PUSHED_NEWS_CACHE_LIMIT,
-            PUSHED_NEWS_CACHE_RETAIN,
-        )
-        self._trim_cache(
-            self._pushed_finnhub_ids,
-            PUSHED_FINNHUB_CACHE_LIMIT,
-            PUSHED_FINNHUB_CACHE_RETAIN,
-        )
-
-        self._last_news_push = datetime.utcnow()
+        self._last_news_push = now
         logger.info(f"News digest pushed (legacy): {len(new_items)} items")
 
     async def _crypto_update_push_job(self) -> None:
@@ -493,21 +641,46 @@ class DataScheduler:
             return
 
         try:
-            from server.bot.formatter import format_crypto_update
-
+            now = datetime.utcnow()
             message = format_crypto_update(
                 crypto_data=self.latest_crypto_data,
                 previous_data=self._previous_crypto_data,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
 
             await self._push_message(message)
-            self._last_crypto_push = datetime.utcnow()
+            self._last_crypto_push = now
             logger.info("Crypto update pushed")
 
         except Exception as e:
             logger.error(f"Crypto update push failed: {e}")
 
+    def record_news_fetch_checkpoint(self, now: datetime, source: str) -> None:
+        """Record the news fetch checkpoint used by the digest job and /continue."""
+        self._last_news_fetch_time = now
+        self._last_news_fetch_monotonic = time.monotonic()
+        self._last_news_fetch_offset = 0  # Reset offset for pagination
+        self._last_news_fetch_source = source
+
+    def _build_market_summary(self) -> str:
+        """Build the one-line index summary, memoized per market data refresh."""
+        cached = self._market_summary_cache
+        if cached is not None and cached[0] == self._market_data_version:
+            return cached[1]
+
+        parts = []
+        indices = self.latest_market_data.get("indices") or []
+        for idx in indices[:3]:
+            if isinstance(idx, dict):
+                name = idx.get("name", "")
+                change = idx.get("change_percent", 0) or 0
+                sign = "+" if change >= 0 else ""
+                parts.append(f"{name} {sign}{change:.1f}%")
+        market_summary = " | ".join(parts)
+
+        self._market_summary_cache = (self._market_data_version, market_summary)
+        return market_summary
+
     async def _morning_briefing_job(self) -> None:
         """Push morning briefing at MORNING_BRIEFING_HOUR UTC."""
         if not self._has_push_bot or not self._db_session_factory:
@@ -516,68 +689,26 @@ class DataScheduler:
         try:
             # Use unified processor if available
             if self._news_processor:
-                from server.bot.formatter import format_morning_briefing
-
-                # Build market summary
-                market_summary = ""
-                if self.latest_market_data.get("indices"):
-                    indices = self.latest_market_data["indices"]
-                    parts = []
-                    for idx in indices[:3]:
-                        if isinstance(idx, dict):
-                            name = idx.get("name", "")
-                            change = idx.get("change_percent", 0) or 0
-                            sign = "+" if change >= 0 else ""
-                            parts.append(f"{name} {sign}{change:.1f}%")
-                    if parts:
-                        market_summary = " | ".join(parts)
-
-                # Push to each platform with separate deduplication
-                for platform in ("telegram", "feishu"):
-                    bot = (
-                        self._telegram_bot
-                        if platform == "telegram"
-                        else self._feishu_bot
-                    )
-                    if not bot:
-                        continue
-
-                    items = await self._news_processor.get_and_process_news(
-                        hours=BRIEFING_TIME_WINDOW_HOURS,
-                        max_items=10,
-                        filter_pushed=False,  # Briefing shows all important news
-                        push_type="morning",
-                        use_cache=True,
-                        platform=platform,
-                    )
-
-                    if not items:
-                        continue
-
-                    # Filter by importance (>=3 for briefing)
-                    items = [i for i in items if i.importance >= 3][:5]
-
-                    if not items:
-                        continue
-
-                    message = format_morning_briefing(
-                        highlights=items,
-                        market_summary=market_summary,
-                        date=datetime.utcnow(),
-                    )
+                # Briefings don't filter by push log, so one fetch serves all platforms
+                items = await self._news_processor.get_and_process_news(
+                    hours=BRIEFING_TIME_WINDOW_HOURS,
+                    max_items=BRIEFING_MAX_ITEMS,
+                    filter_pushed=False,  # Briefing shows all important news
+                    push_type="morning",
+                    use_cache=True,
+                    min_importance=BRIEFING_MIN_IMPORTANCE,
+                )
+                if not items:
+                    return
 
-                    try:
-                        await self._push_to_platform(platform, message)
-                        await self._news_processor.mark_as_pushed(
-                            items, push_type="morning", platform=platform
-                        )
-                        logger.info(
-                            f"[{platform.title()}] Morning briefing pushed: {len(items)} items"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"{platform.title()} morning briefing push failed: {e}"
-                        )
+                message = format_morning_briefing(
+                    highlights=items,
+                    market_summary=self._build_market_summary(),
+                    date=datetime.utcnow(),
+                )
+                await self._push_and_mark_all(
+                    message, items, push_type="morning", label="Morning briefing"
+                )
             else:
                 # Legacy fallback
                 await self._morning_briefing_job_legacy()
@@ -587,8 +718,6 @@ class DataScheduler:
 
     async def _morning_briefing_job_legacy(self) -> None:
         """Legacy morning briefing push (fallback when NewsProcessor not available)."""
-        from server.bot.formatter import format_morning_briefing
-
         # Get news from last 12 hours
         news_items = await self._get_recent_news(hours=BRIEFING_TIME_WINDOW_HOURS)
         if not news_items:
@@ -608,23 +737,9 @@ class DataScheduler:
                 aggregated, max_items=10
             )
 
-        # Build market summary
-        market_summary = ""
-        if self.latest_market_data.get("indices"):
-            indices = self.latest_market_data["indices"]
-            parts = []
-            for idx in indices[:3]:
-                if isinstance(idx, dict):
-                    name = idx.get("name", "")
-                    change = idx.get("change_percent", 0) or 0
-                    sign = "+" if change >= 0 else ""
-                    parts.append(f"{name} {sign}{change:.1f}%")
-            if parts:
-                market_summary = " | ".join(parts)
-
         message = format_morning_briefing(
             highlights=aggregated,
-            market_summary=market_summary,
+            market_summary=self._build_market_summary(),
             date=datetime.utcnow(),
         )
 
@@ -639,51 +754,24 @@ class DataScheduler:
         try:
             # Use unified processor if available
             if self._news_processor:
-                from server.bot.formatter import format_evening_briefing
-
-                # Push to each platform with separate deduplication
-                for platform in ("telegram", "feishu"):
-                    bot = (
-                        self._telegram_bot
-                        if platform == "telegram"
-                        else self._feishu_bot
-                    )
-                    if not bot:
-                        continue
-
-                    items = await self._news_processor.get_and_process_news(
-                        hours=BRIEFING_TIME_WINDOW_HOURS,
-                        max_items=10,
-                        filter_pushed=False,  # Briefing shows all important news
-                        push_type="evening",
-                        use_cache=True,
-                        platform=platform,
-                    )
-
-                    if not items:
-                        continue
-
-                    # Filter by importance (>=3 for briefing)
-                    items = [i for i in items if i.importance >= 3][:5]
-
-                    if not items:
-                        continue
+                # Briefings don't filter by push log, so one fetch serves all platforms
+                items = await self._news_processor.get_and_process_news(
+                    hours=BRIEFING_TIME_WINDOW_HOURS,
+                    max_items=BRIEFING_MAX_ITEMS,
+                    filter_pushed=False,  # Briefing shows all important news
+                    push_type="evening",
+                    use_cache=True,
+                    min_importance=BRIEFING_MIN_IMPORTANCE,
+                )
+                if not items:
+                    return
 
-                    message = format_evening_briefing(
-                        highlights=items, date=datetime.utcnow()
-                    )
-                    try:
-                        await self._push_to_platform(platform, message)
-                        await self._news_processor.mark_as_pushed(
-                            items, push_type="evening", platform=platform
-                        )
-                        logger.info(
-                            f"[{platform.title()}] Evening briefing pushed: {len(items)} items"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"{platform.title()} evening briefing push failed: {e}"
-                        )
+                message = format_evening_briefing(
+                    highlights=items, date=datetime.utcnow()
+                )
+                await self._push_and_mark_all(
+                    message, items, push_type="evening", label="Evening briefing"
+                )
             else:
                 # Legacy fallback
                 await self._evening_briefing_job_legacy()
@@ -693,8 +781,6 @@ class DataScheduler:
 
     async def _evening_briefing_job_legacy(self) -> None:
         """Legacy evening briefing push (fallback when NewsProcessor not available)."""
-        from server.bot.formatter import format_evening_briefing
-
         # Get news from last 12 hours
         news_items = await self._get_recent_news(hours=BRIEFING_TIME_WINDOW_HOURS)
         if not news_items:
@@ -725,7 +811,7 @@ class DataScheduler:
 
     async def _finnhub_news_job(self) -> None:
         """Fetch Finnhub market news and merge into news digest."""
-        if not self._finnhub_news or not self._finnhub_news.is_configured():
+        if not self._finnhub_enabled or not self._finnhub_news:
             return
 
         try:
@@ -733,11 +819,19 @@ class DataScheduler:
             news_items = await self._finnhub_news.fetch_market_news(category="general")
 
             # Also fetch news for watchlist stocks
+            finnhub_news = self._finnhub_news
             watchlist = global_settings.watchlist_symbols or []
-            for symbol in watchlist[:WATCHLIST_SYMBOLS_FETCH_LIMIT]:
-                company_news = await self._finnhub_news.fetch_company_news(
-                    symbol, days=1
-                )
+            symbols = watchlist[:WATCHLIST_SYMBOLS_FETCH_LIMIT]
+            results = await self._fetch_for_symbols(
+                lambda symbol: finnhub_news.fetch_company_news(symbol, days=1),
+                symbols,
+            )
+            for symbol, company_news in zip(symbols, results):
+                if isinstance(company_news, BaseException):
+                    logger.error(
+                        f"Company news fetch failed for {symbol}: {company_news}"
+                    )
+                    continue
                 news_items.extend(company_news[:WATCHLIST_COMPANY_NEWS_ITEMS])
 
             logger.info(f"Finnhub news fetch: {len(news_items)} items")
@@ -750,137 +844,150 @@ class DataScheduler:
 
     async def _insider_alert_job(self) -> None:
         """Check for significant insider transactions on watchlist stocks."""
-        if not self._has_push_bot or not self._finnhub_news:
-            return
-        if not self._finnhub_news.is_configured():
+        # Only scheduled (or manually triggered) when Finnhub and a push bot exist
+        if self._finnhub_news is None:
             return
 
         try:
-            from server.bot.formatter import format_insider_alert
-
             watchlist = global_settings.watchlist_symbols or []
+            symbols = watchlist[:WATCHLIST_SYMBOLS_FETCH_LIMIT]
             significant_transactions = []
 
-            for symbol in watchlist[:WATCHLIST_SYMBOLS_FETCH_LIMIT]:
-                transactions = await self._finnhub_news.fetch_insider_transactions(
-                    symbol
-                )
+            results = await self._fetch_for_symbols(
+                self._finnhub_news.fetch_insider_transactions, symbols
+            )
+
+            # Bound once; the loop below runs for every fetched transaction
+            alerted_ids = self._alerted_insider_ids
+            is_deduped = self._is_deduped
+            add_significant = significant_transactions.append
+
+            for symbol, transactions in zip(symbols, results):
+                if isinstance(transactions, BaseException):
+                    logger.error(
+                        f"Insider transaction fetch failed for {symbol}: {transactions}"
+                    )
+                    continue
 
                 for tx in transactions:
-                    # Skip if already alerted
-                    if tx.transaction_id in self._alerted_insider_ids:
+                    # Only alert on significant transactions; purchases are
+                    # stronger signals so they have a lower bar than sales.
+                    # Most transactions fail this, so check it before dedup.
+                    threshold = (
+                        INSIDER_PURCHASE_THRESHOLD_USD
+                        if tx.transaction_code == "P"
+                        else INSIDER_SALE_THRESHOLD_USD
+                    )
+                    if abs(tx.change * tx.transaction_price) < threshold:
                         continue
 
-                    # Only alert on significant transactions
-                    tx_value = abs(tx.change * tx.transaction_price)
-                    is_purchase = tx.transaction_code == "P"
+                    # Skip if already alerted
+                    if is_deduped(alerted_ids, "insider", tx.transaction_id):
+                        continue
 
-                    # Purchases are more significant signals
-                    if is_purchase and tx_value >= INSIDER_PURCHASE_THRESHOLD_USD:
-                        significant_transactions.append(tx)
-                        self._alerted_insider_ids.add(tx.transaction_id)
-                    # Large sales are also worth noting
-                    elif not is_purchase and tx_value >= INSIDER_SALE_THRESHOLD_USD:
-                        significant_transactions.append(tx)
-                        self._alerted_insider_ids.add(tx.transaction_id)
+                    add_significant(tx)
 
+            significant_transactions = await self._claim_shared_alerts(
+                "insider", significant_transactions, lambda tx: tx.transaction_id
+            )
             if significant_transactions:
                 message = format_insider_alert(significant_transactions)
-                await self._push_message(message)
+                await self._push_message(
+                    message,
+                    on_result=self._alert_push_callback(
+                        "insider",
+                        alerted_ids,
+                        [tx.transaction_id for tx in significant_transactions],
+                    ),
+                )
                 logger.info(
                     f"Insider alert pushed: {len(significant_transactions)} transactions"
                 )
 
-            # Limit cache size
-            self._trim_cache(
-                self._alerted_insider_ids,
-                ALERTED_INSIDER_CACHE_LIMIT,
-                ALERTED_INSIDER_CACHE_RETAIN,
-            )
-
         except Exception as e:
             logger.error(f"Insider alert job failed: {e}")
 
     async def _earnings_alert_job(self) -> None:
         """Alert on upcoming earnings for watchlist stocks."""
-        if not self._has_push_bot or not self._finnhub_news:
-            return
-        if not self._finnhub_news.is_configured():
+        # Only scheduled (or manually triggered) when Finnhub and a push bot exist
+        if self._finnhub_news is None:
             return
 
         try:
-            from server.bot.formatter import format_earnings_alert
-
-            watchlist = set(global_settings.watchlist_symbols or [])
+            watchlist = global_settings.watchlist_symbols_set
             earnings = await self._finnhub_news.fetch_earnings_calendar(days=3)
 
-            # Filter for watchlist stocks
+            # Filter for watchlist stocks; the calendar covers the whole market,
+            # so only build dedup keys for events that pass the symbol check
+            def alert_key(event: Any) -> str:
+                return f"{event.symbol}_{event.report_date.date()}"
+
             watchlist_earnings = []
             for event in earnings:
-                alert_key = f"{event.symbol}_{event.report_date.date()}"
-                if (
-                    event.symbol in watchlist
-                    and alert_key not in self._alerted_earnings
+                if event.symbol not in watchlist:
+                    continue
+                if not self._is_deduped(
+                    self._alerted_earnings, "earnings", alert_key(event)
                 ):
                     watchlist_earnings.append(event)
-                    self._alerted_earnings.add(alert_key)
 
+            watchlist_earnings = await self._claim_shared_alerts(
+                "earnings", watchlist_earnings, alert_key
+            )
             if watchlist_earnings:
                 message = format_earnings_alert(watchlist_earnings)
-                await self._push_message(message)
+                await self._push_message(
+                    message,
+                    on_result=self._alert_push_callback(
+                        "earnings",
+                        self._alerted_earnings,
+                        [alert_key(event) for event in watchlist_earnings],
+                    ),
+                )
                 logger.info(f"Earnings alert pushed: {len(watchlist_earnings)} events")
 
-            # Limit cache size
-            self._trim_cache(
-                self._alerted_earnings,
-                ALERTED_EARNINGS_CACHE_LIMIT,
-                ALERTED_EARNINGS_CACHE_RETAIN,
-            )
-
         except Exception as e:
             logger.error(f"Earnings alert job failed: {e}")
 
+    @staticmethod
+    def _classify_price_move(
+        price: float, change_pct: float, prev_price: float | None
+    ) -> str:
+        """Return the anomaly type for a quote, or "" if the move is normal."""
+        # Intraday movement > 3% from last check takes precedence
+        if prev_price and prev_price > 0:
+            intraday_change = ((price - prev_price) / prev_price) * 100
+            if abs(intraday_change) >= MARKET_ANOMALY_INTRADAY_THRESHOLD_PCT:
+                return "intraday_spike" if intraday_change > 0 else "intraday_drop"
+
+        # Daily change > 5%
+        if abs(change_pct) >= MARKET_ANOMALY_DAILY_THRESHOLD_PCT:
+            return "daily_spike" if change_pct > 0 else "daily_drop"
+
+        return ""
+
     async def _market_anomaly_job(self) -> None:
         """Detect significant price movements in watchlist stocks."""
-        if not self._has_push_bot or not self._finnhub_news:
-            return
-        if not self._finnhub_news.is_configured():
+        # Only scheduled (or manually triggered) when Finnhub and a push bot exist
+        if self._finnhub_news is None:
             return
 
         try:
-            from server.bot.formatter import format_market_anomaly_alert
-
             watchlist = global_settings.watchlist_symbols or []
+            symbols = watchlist[:WATCHLIST_SYMBOLS_FETCH_LIMIT]
             anomalies = []
 
-            for symbol in watchlist[:WATCHLIST_SYMBOLS_FETCH_LIMIT]:
-                quote = await self._finnhub_news.fetch_quote(symbol)
-                if not quote:
-                    continue
-
+            quotes = await self._finnhub_news.fetch_quotes_bulk(symbols)
+            previous_prices = self._previous_watchlist_prices
+            for symbol, quote in quotes.items():
                 price = quote.get("price", 0)
                 change_pct = quote.get("change_percent", 0) or 0
-                prev_price = self._previous_watchlist_prices.get(symbol)
-
-                # Detect anomalies
-                is_anomaly = False
-                anomaly_type = ""
-
-                # Daily change > 5%
-                if abs(change_pct) >= MARKET_ANOMALY_DAILY_THRESHOLD_PCT:
-                    is_anomaly = True
-                    anomaly_type = "daily_spike" if change_pct > 0 else "daily_drop"
-
-                # Intraday movement > 3% from last check
-                if prev_price and prev_price > 0:
-                    intraday_change = ((price - prev_price) / prev_price) * 100
-                    if abs(intraday_change) >= MARKET_ANOMALY_INTRADAY_THRESHOLD_PCT:
-                        is_anomaly = True
-                        anomaly_type = (
-                            "intraday_spike" if intraday_change > 0 else "intraday_drop"
-                        )
+                prev_price = previous_prices.get(symbol)
+                # Update price cache
+                previous_prices[symbol] = price
 
-                if is_anomaly:
+                anomaly_type = self._classify_price_move(price, change_pct, prev_price)
+                if anomaly_type:
                     anomalies.append(
                         {
                             "symbol": symbol,
@@ -891,9 +998,6 @@ class DataScheduler:
                         }
                     )
 
-                # Update price cache
-                self._previous_watchlist_prices[symbol] = price
-
             if anomalies:
                 message = format_market_anomaly_alert(anomalies)
                 await self._push_message(message)
@@ -906,121 +1010,216 @@ class DataScheduler:
     # Helper Methods
     # -------------------------------------------------------------------------
 
-    def _trim_cache(self, cache: set, limit: int, retain: int) -> None:
-        """Trim cache to limit, retaining the most recent items."""
-        if len(cache) > limit:
-            # Convert to list, keep last 'retain' items (most recent)
-            cache_list = list(cache)
-            cache.clear()
-            cache.update(cache_list[-retain:])
-            logger.debug(f"Trimmed cache from {len(cache_list)} to {len(cache)} items")
+    async def _fetch_for_symbols(
+        self, fetch: Callable[[str], Awaitable[Any]], symbols: list[str]
+    ) -> list[Any]:
+        """
+        Run a per-symbol fetch for all symbols concurrently.
+
+        At most WATCHLIST_FETCH_CONCURRENCY requests are in flight to stay
+        within Finnhub rate limits. Results keep the order of ``symbols``;
+        failures are returned as exception objects.
+        """
+        semaphore = asyncio.Semaphore(WATCHLIST_FETCH_CONCURRENCY)
+
+        async def _fetch_one(symbol: str) -> Any:
+            async with semaphore:
+                return await fetch(symbol)
+
+        return await asyncio.gather(
+            *(_fetch_one(symbol) for symbol in symbols), return_exceptions=True
+        )
 
     def _format_crypto_for_summary(self) -> dict:
         """Convert crypto list to dict format for formatter."""
-        result = {}
-        for item in self.latest_crypto_data:
-            if isinstance(item, dict) and "id" in item:
-                coin_id = item["id"]
-                result[coin_id] = {
-                    "usd": item.get("current_price", 0),
-                    "usd_24h_change": item.get("price_change_percentage_24h", 0),
-                }
-        return result
+        return {
+            item["id"]: {
+                "usd": item.get("current_price", 0),
+                "usd_24h_change": item.get("price_change_percentage_24h", 0),
+            }
+            for item in self.latest_crypto_data
+            if isinstance(item, dict) and "id" in item
+        }
 
     async def _get_recent_news(self, hours: float = 1) -> list[dict]:
         """Get recent news articles from database and Finnhub."""
-        import time
-
         start_time = time.time()
         logger.info(f"[新闻获取] 开始获取最近 {hours} 小时的新闻...")
 
-        news_items = []
-        rss_count = 0
-        finnhub_count = 0
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
 
-        # Get RSS articles from database
-        if self._db_session_factory:
-            try:
-                rss_start = time.time()
-                from sqlalchemy import select
-                from server.datastore.models import RSSArticleDB
-
-                cutoff = datetime.utcnow() - timedelta(hours=hours)
-
-                async with self._db_session_factory() as session:
-                    query = (
-                        select(RSSArticleDB)
-                        .where(RSSArticleDB.fetched_at >= cutoff)
-                        .order_by(RSSArticleDB.fetched_at.desc())
-                        .limit(200)
-                    )
+        # The Finnhub filter runs while the RSS query is waiting on the database
+        rss_items, finnhub_items = await asyncio.gather(
+            self._fetch_rss_news(cutoff), self._filter_finnhub_news(cutoff)
+        )
+        news_items = rss_items + finnhub_items
 
-                    result = await session.execute(query)
-                    articles = result.scalars().all()
-
-                    for a in articles:
-                        news_items.append(
-                            {
-                                "title": a.title,
-                                "source": a.feed_name,
-                                "source_type": "rss",
-                                "published": a.published,
-                                "summary": a.summary,
-                                "link": a.link,
-                                "category": getattr(a, "category", ""),
-                            }
-                        )
-                    rss_count = len(articles)
+        # Sort by published date
+        news_items.sort(key=published_sort_key, reverse=True)
 
-                rss_elapsed = time.time() - rss_start
-                logger.info(
-                    f"[新闻获取] RSS 获取完成，耗时 {rss_elapsed:.2f}s，共 {rss_count} 条"
+        total_elapsed = time.time() - start_time
+        logger.info(
+            f"[新闻获取] 完成，总耗时 {total_elapsed:.2f}s（RSS {len(rss_items)} + Finnhub {len(finnhub_items)} = 总共 {len(news_items)} 条）"
+        )
+
+        return news_items
+
+    async def _fetch_rss_news(self, cutoff: datetime) -> list[dict]:
+        """Get RSS articles fetched since ``cutoff`` from the database."""
+        if not self._db_session_factory:
+            return []
+
+        if cutoff < datetime.utcnow() - timedelta(hours=RSS_WINDOW_HOURS):
+            # Longer than the in-memory window (e.g. daily reports)
+            return await self._query_rss_news(cutoff)
+
+        rss_start = time.time()
+        async with self._rss_window_lock:
+            await self._refresh_rss_window()
+
+            news_items = []
+            for _, fetched_at, item in reversed(self._rss_window):
+                if fetched_at < cutoff or len(news_items) >= RSS_RECENT_NEWS_LIMIT:
+                    break
+                news_items.append(dict(item))
+
+        rss_elapsed = time.time() - rss_start
+        logger.info(
+            f"[新闻获取] RSS 获取完成，耗时 {rss_elapsed:.2f}s，共 {len(news_items)} 条"
+        )
+        return news_items
+
+    async def _refresh_rss_window(self) -> None:
+        """Merge in RSS rows fetched since the last refresh and drop expired ones."""
+        window = self._rss_window
+        horizon = datetime.utcnow() - timedelta(hours=RSS_WINDOW_HOURS)
+        since = horizon
+        if window:
+            # Ids don't become visible in commit order across transactions, so
+            # overlap on fetched_at and skip rows already in the window by id
+            since = max(horizon, window[-1][1] - RSS_WINDOW_REFRESH_OVERLAP)
+        try:
+            # Only the newest RSS_RECENT_NEWS_LIMIT rows can ever be served
+            query = (
+                select(
+                    RSSArticleDB.id, RSSArticleDB.fetched_at, *self._rss_news_columns()
                 )
+                .where(RSSArticleDB.fetched_at >= since)
+                .order_by(RSSArticleDB.fetched_at.desc())
+                .limit(RSS_RECENT_NEWS_LIMIT)
+                .execution_options(yield_per=RSS_QUERY_YIELD_PER)
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to get RSS news: {e}")
+            new_rows = []
+            async with self._db_session_factory() as session:
+                result = await session.stream(query)
+                async for row in result:
+                    if row.id not in self._rss_window_ids:
+                        new_rows.append(
+                            (row.id, row.fetched_at, self._rss_row_to_item(row))
+                        )
 
-        # Get Finnhub news from memory cache
-        finnhub_start = time.time()
-        if self._latest_finnhub_news:
-            cutoff = datetime.utcnow() - timedelta(hours=hours)
-            for fn in self._latest_finnhub_news:
-                if fn.published_at >= cutoff:
-                    news_items.append(
-                        {
-                            "title": fn.headline,
-                            "source": fn.source,
-                            "source_type": "finnhub",
-                            "published": fn.published_at,
-                            "summary": fn.summary,
-                            "link": fn.url,
-                            "category": fn.category,
-                            "related_symbols": fn.related_symbols,
-                        }
+            if new_rows:
+                new_rows.reverse()
+                self._rss_window_ids.update(row[0] for row in new_rows)
+                if window and new_rows[0][1] < window[-1][1]:
+                    # Late commits: merge to keep the window ordered by fetched_at
+                    window = self._rss_window = deque(
+                        heapq.merge(window, new_rows, key=lambda row: row[1])
                     )
-            finnhub_count = len(
-                [n for n in news_items if n.get("source_type") == "finnhub"]
+                else:
+                    window.extend(new_rows)
+
+        except Exception as e:
+            # Keep serving the previous window; the next call retries
+            logger.error(f"Failed to get RSS news: {e}")
+
+        while window and (
+            window[0][1] < horizon or len(window) > RSS_RECENT_NEWS_LIMIT
+        ):
+            self._rss_window_ids.discard(window.popleft()[0])
+
+    async def _query_rss_news(self, cutoff: datetime) -> list[dict]:
+        """Query the newest RSS articles fetched since ``cutoff`` directly."""
+        news_items = []
+        try:
+            rss_start = time.time()
+            async with self._db_session_factory() as session:
+                # Only the columns the digest needs, streamed in chunks
+                # instead of hydrating full ORM objects
+                query = (
+                    select(*self._rss_news_columns())
+                    .where(RSSArticleDB.fetched_at >= cutoff)
+                    .order_by(RSSArticleDB.fetched_at.desc())
+                    .limit(RSS_RECENT_NEWS_LIMIT)
+                    .execution_options(yield_per=RSS_QUERY_YIELD_PER)
+                )
+
+                result = await session.stream(query)
+                async for row in result:
+                    news_items.append(self._rss_row_to_item(row))
+
+            rss_elapsed = time.time() - rss_start
+            logger.info(
+                f"[新闻获取] RSS 获取完成，耗时 {rss_elapsed:.2f}s，共 {len(news_items)} 条"
             )
 
-        finnhub_elapsed = time.time() - finnhub_start
-        logger.info(
-            f"[新闻获取] Finnhub 获取完成，耗时 {finnhub_elapsed:.2f}s，共 {finnhub_count} 条"
+        except Exception as e:
+            logger.error(f"Failed to get RSS news: {e}")
+
+        return news_items
+
+    @staticmethod
+    def _rss_news_columns() -> tuple[Any, ...]:
+        """Columns of RSSArticleDB needed to build a news item."""
+        return (
+            RSSArticleDB.title,
+            RSSArticleDB.feed_name,
+            RSSArticleDB.published,
+            RSSArticleDB.summary,
+            RSSArticleDB.link,
+            RSSArticleDB.category,
         )
 
-        # Sort by published date
-        news_items.sort(key=lambda x: x.get("published", datetime.min), reverse=True)
+    @staticmethod
+    def _rss_row_to_item(row: Any) -> dict:
+        """Convert a projected RSS row into a news item dict."""
+        return {
+            "title": row.title,
+            "source": row.feed_name,
+            "source_type": "rss",
+            "published": row.published,
+            "summary": row.summary,
+            "link": row.link,
+            "category": row.category,
+        }
 
-        total_elapsed = time.time() - start_time
+    async def _filter_finnhub_news(self, cutoff: datetime) -> list[dict]:
+        """Get Finnhub news published since ``cutoff`` from the memory cache."""
+        finnhub_start = time.time()
+        news_items = [
+            {
+                "title": fn.headline,
+                "source": fn.source,
+                "source_type": "finnhub",
+                "published": fn.published_at,
+                "summary": fn.summary,
+                "link": fn.url,
+                "category": fn.category,
+                "related_symbols": fn.related_symbols,
+            }
+            for fn in self._latest_finnhub_news
+            if fn.published_at >= cutoff
+        ]
+
+        finnhub_elapsed = time.time() - finnhub_start
         logger.info(
-            f"[新闻获取] 完成，总耗时 {total_elapsed:.2f}s（RSS {rss_count} + Finnhub {finnhub_count} = 总共 {len(news_items)} 条）"
+            f"[新闻获取] Finnhub 获取完成，耗时 {finnhub_elapsed:.2f}s，共 {len(news_items)} 条"
         )
-
         return news_items
 
     async def _build_report_context(self, hours: int = 24) -> Any:
         """Build report context from available data."""
-        from server.reports.generator import ReportDataContext
-
         news_items = await self._get_recent_news(hours=hours)
 
         correlation_results = None
@@ -1034,6 +1233,129 @@ class DataScheduler:
             correlation_results=correlation_results,
         )
 
+    # -------------------------------------------------------------------------
+    # Push Dedup State
+    # -------------------------------------------------------------------------
+
+    def _is_deduped(self, ids: BoundedSet, namespace: str, key: str) -> bool:
+        """Check the in-memory set first, then the persisted filter."""
+        return key in ids or f"{namespace}:{key}" in self._push_dedup_filter
+
+    def _mark_deduped(self, ids: BoundedSet, namespace: str, key: str) -> None:
+        """Record an ID as pushed in both the in-memory set and the filter."""
+        ids.add(key)
+        if self._push_dedup_filter.is_full:
+            self._rotate_push_dedup_filter()
+        self._push_dedup_filter.add(f"{namespace}:{key}")
+        self._push_dedup_dirty = True
+
+    def _rotate_push_dedup_filter(self) -> None:
+        """Start a fresh filter generation seeded with the in-memory IDs."""
+        dedup_filter = self._push_dedup_filter
+        dedup_filter.clear()
+        for namespace, ids in self._dedup_sets.items():
+            for key in ids:
+                dedup_filter.add(f"{namespace}:{key}")
+
+    def _load_push_dedup_state(self) -> None:
+        """Load the persisted dedup filter written by a previous run."""
+        path = Path(global_settings.push_dedup_state_path)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Failed to read push dedup state: {e}")
+            return
+
+        if self._push_dedup_filter.load_bytes(data):
+            logger.info(f"Loaded push dedup state: {len(self._push_dedup_filter)} IDs")
+        else:
+            logger.warning("Push dedup state size mismatch, starting fresh")
+
+    def _save_push_dedup_state(self) -> None:
+        """Write the dedup filter to disk if it changed since the last save."""
+        if not self._push_dedup_dirty:
+            return
+
+        path = Path(global_settings.push_dedup_state_path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(self._push_dedup_filter.to_bytes())
+            tmp_path.replace(path)
+            self._push_dedup_dirty = False
+        except OSError as e:
+            logger.error(f"Failed to save push dedup state: {e}")
+
+    async def _push_dedup_persist_job(self) -> None:
+        """Periodically flush the dedup filter to disk."""
+        self._save_push_dedup_state()
+
+    async def _claim_shared_alerts(
+        self, namespace: str, items: list[Any], key: Callable[[Any], str]
+    ) -> list[Any]:
+        """
+        Drop alerts another scheduler process already claimed and claim the rest.
+
+        Claims are an atomic insert on a unique key in the shared database, so
+        when several schedulers race on the same alert exactly one of them
+        gets it back and sends it.
+        """
+        # Duplicates within one batch only go out once
+        unique: dict[str, Any] = {}
+        for item in items:
+            unique.setdefault(key(item), item)
+        if not unique or not self._db_session_factory:
+            return list(unique.values())
+
+        try:
+            async with self._db_session_factory() as session:
+                claimed_keys = await AlertClaimRepository(session).claim(
+                    namespace, list(unique), hours=SHARED_ALERT_DEDUP_HOURS
+                )
+                await session.commit()
+        except Exception as e:
+            # The local dedup sets already filtered these; don't drop alerts
+            logger.warning(f"Shared {namespace} dedup check failed: {e}")
+            return list(unique.values())
+
+        # Expired claims can be re-claimed anyway, so keeping them only grows the table
+        try:
+            async with self._db_session_factory() as session:
+                await AlertClaimRepository(session).cleanup_expired(
+                    hours=SHARED_ALERT_DEDUP_HOURS
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Alert claim cleanup failed: {e}")
+
+        return [item for k, item in unique.items() if k in claimed_keys]
+
+    async def _release_shared_alerts(self, namespace: str, keys: list[str]) -> None:
+        """Give up claims on alerts that couldn't be sent so a later run retries."""
+        if not keys or not self._db_session_factory:
+            return
+        try:
+            async with self._db_session_factory() as session:
+                await AlertClaimRepository(session).release(namespace, keys)
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Releasing {namespace} alert claims failed: {e}")
+
+    def _alert_push_callback(
+        self, namespace: str, ids: BoundedSet, keys: list[str]
+    ) -> PushCallback:
+        """Mark claimed alerts as pushed once sent, or release the claims."""
+
+        async def on_result(sent: bool) -> None:
+            if sent:
+                for key in keys:
+                    self._mark_deduped(ids, namespace, key)
+            else:
+                await self._release_shared_alerts(namespace, keys)
+
+        return on_result
+
     # -------------------------------------------------------------------------
     # Scheduler Lifecycle
     # -------------------------------------------------------------------------
@@ -1095,18 +1417,24 @@ class DataScheduler:
         # ── Push notification jobs ────────────────────────────────────────────
 
         if self._has_push_bot and settings.push_enabled:
-            # News digest push
-            self.scheduler.add_job(
-                self._news_digest_push_job,
-                trigger="interval",
-                minutes=NEWS_DIGEST_INTERVAL_MINUTES,
-                id="news_digest_push",
-                name="News Digest Push",
-                replace_existing=True,
-            )
-            logger.info(
-                f"News digest push job: every {NEWS_DIGEST_INTERVAL_MINUTES} min"
-            )
+            # Digest and briefing jobs read articles from the database, so they
+            # are only registered when a session factory was injected
+            if self._db_session_factory:
+                # News digest push
+                self.scheduler.add_job(
+                    self._news_digest_push_job,
+                    trigger="interval",
+                    minutes=NEWS_DIGEST_INTERVAL_MINUTES,
+                    id="news_digest_push",
+                    name="News Digest Push",
+                    replace_existing=True,
+                    # A slow LLM run queues the next one on _news_digest_lock
+                    # rather than having it dropped as a misfire
+                    max_instances=2,
+                )
+                logger.info(
+                    f"News digest push job: every {NEWS_DIGEST_INTERVAL_MINUTES} min"
+                )
 
             # Crypto update push
             if self._crypto_source:
@@ -1122,29 +1450,30 @@ class DataScheduler:
                     f"Crypto update push job: every {CRYPTO_UPDATE_INTERVAL_MINUTES} min"
                 )
 
-            # Morning briefing
-            self.scheduler.add_job(
-                self._morning_briefing_job,
-                trigger=CronTrigger(hour=MORNING_BRIEFING_HOUR, minute=0),
-                id="morning_briefing",
-                name="Morning Briefing Push",
-                replace_existing=True,
-            )
-            logger.info(f"Morning briefing job: {MORNING_BRIEFING_HOUR}:00 UTC")
+            if self._db_session_factory:
+                # Morning briefing
+                self.scheduler.add_job(
+                    self._morning_briefing_job,
+                    trigger=CronTrigger(hour=MORNING_BRIEFING_HOUR, minute=0),
+                    id="morning_briefing",
+                    name="Morning Briefing Push",
+                    replace_existing=True,
+                )
+                logger.info(f"Morning briefing job: {MORNING_BRIEFING_HOUR}:00 UTC")
 
-            # Evening briefing
-            self.scheduler.add_job(
-                self._evening_briefing_job,
-                trigger=CronTrigger(hour=EVENING_BRIEFING_HOUR, minute=0),
-                id="evening_briefing",
-                name="Evening Briefing Push",
-                replace_existing=True,
-            )
-            logger.info(f"Evening briefing job: {EVENING_BRIEFING_HOUR}:00 UTC")
+                # Evening briefing
+                self.scheduler.add_job(
+                    self._evening_briefing_job,
+                    trigger=CronTrigger(hour=EVENING_BRIEFING_HOUR, minute=0),
+                    id="evening_briefing",
+                    name="Evening Briefing Push",
+                    replace_existing=True,
+                )
+                logger.info(f"Evening briefing job: {EVENING_BRIEFING_HOUR}:00 UTC")
 
         # ── Finnhub-based jobs ─────────────────────────────────────────────────
 
-        if self._finnhub_news and self._finnhub_news.is_configured():
+        if self._finnhub_enabled:
             # Finnhub news fetch
             self.scheduler.add_job(
                 self._finnhub_news_job,
@@ -1196,15 +1525,47 @@ class DataScheduler:
                     f"Market anomaly job: every {MARKET_ANOMALY_INTERVAL_MINUTES} min"
                 )
 
+        if self._has_push_bot and settings.push_enabled:
+            self._load_push_dedup_state()
+            self.scheduler.add_job(
+                self._push_dedup_persist_job,
+                trigger="interval",
+                minutes=PUSH_DEDUP_PERSIST_INTERVAL_MINUTES,
+                id="push_dedup_persist",
+                name="Push Dedup State Persist",
+                replace_existing=True,
+            )
+
+        self._push_worker_task = asyncio.create_task(self._push_worker())
+
         self.scheduler.start()
         self._is_running = True
         logger.info("DataScheduler started")
 
-    def stop(self) -> None:
-        """Stop the scheduler."""
+    async def stop(self) -> None:
+        """Stop the scheduler, giving queued pushes a chance to go out first."""
         if not self._is_running:
             return
         self.scheduler.shutdown(wait=False)
+        if self._push_worker_task:
+            try:
+                await asyncio.wait_for(
+                    self._push_queue.join(), PUSH_QUEUE_DRAIN_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                logger.warning(
+                    f"Push queue not drained in {PUSH_QUEUE_DRAIN_TIMEOUT_SECONDS}s, "
+                    f"abandoning {self._push_queue.qsize()} messages"
+                )
+            self._push_worker_task.cancel()
+            self._push_worker_task = None
+            # Whatever is left was never sent: let its callbacks release claims
+            while not self._push_queue.empty():
+                _, on_result = self._push_queue.get_nowait()
+                self._push_queue.task_done()
+                if on_result:
+                    await on_result(False)
+        self._save_push_dedup_state()
         self._is_running = False
         logger.info("DataScheduler stopped")
 
@@ -1224,7 +1585,7 @@ class DataScheduler:
             tasks.append(self._market_job())
         if self._economic_source:
             tasks.append(self._economic_job())
-        if self._finnhub_news and self._finnhub_news.is_configured():
+        if self._finnhub_enabled:
             tasks.append(self._finnhub_news_job())
 
         if tasks:
@@ -1247,17 +1608,24 @@ class DataScheduler:
         """Manually trigger evening briefing."""
         await self._evening_briefing_job()
 
+    def _can_push_finnhub_alerts(self) -> bool:
+        """Whether the Finnhub alert jobs have a data source and a bot to push to."""
+        return self._has_push_bot and self._finnhub_enabled
+
     async def trigger_insider_alert(self) -> None:
         """Manually trigger insider trading alert."""
-        await self._insider_alert_job()
+        if self._can_push_finnhub_alerts():
+            await self._insider_alert_job()
 
     async def trigger_earnings_alert(self) -> None:
         """Manually trigger earnings calendar alert."""
-        await self._earnings_alert_job()
+        if self._can_push_finnhub_alerts():
+            await self._earnings_alert_job()
 
     async def trigger_market_anomaly(self) -> None:
         """Manually trigger market anomaly detection."""
-        await self._market_anomaly_job()
+        if self._can_push_finnhub_alerts():
+            await self._market_anomaly_job()
 
     async def trigger_finnhub_news(self) -> None:
         """Manually trigger Finnhub news fetch."""
@@ -1288,8 +1656,7 @@ class DataScheduler:
                 "crypto": self._crypto_source is not None,
                 "markets": self._market_source is not None,
                 "economic": self._economic_source is not None,
-                "finnhub_news": self._finnhub_news is not None
-                and self._finnhub_news.is_configured(),
+                "finnhub_news": self._finnhub_enabled,
             },
             "push": {
                 "telegram": self._telegram_bot is not None,
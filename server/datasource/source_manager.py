@@ -49,8 +49,13 @@ class SourceManager:
         self.config: SourceConfig = SourceConfig()
         self._load_config()
 
+        # 分类配置只在加载时校验一次
+        self._categories: list[CategoryConfig] = []
+        self._parse_categories()
+
         # 构建源优先级映射缓存
         self._feed_priority_map: dict[str, int] = {}
+        self._enabled_feeds_cache: list[FeedConfig] | None = None
         self._build_priority_map()
 
     def _load_config(self) -> None:
@@ -145,13 +150,17 @@ class SourceManager:
         except Exception as e:
             logger.error(f"Failed to migrate from JSON config: {e}")
 
+    def _parse_categories(self) -> None:
+        """将rss_categories解析为CategoryConfig对象"""
+        rss_categories = self.config.sources.get("rss_categories", [])
+        self._categories = [CategoryConfig(**cat_dict) for cat_dict in rss_categories]
+
     def _build_priority_map(self) -> None:
         """构建源优先级映射缓存"""
         self._feed_priority_map.clear()
+        self._enabled_feeds_cache = None
 
-        rss_categories = self.config.sources.get("rss_categories", [])
-        for cat_dict in rss_categories:
-            category = CategoryConfig(**cat_dict)
+        for category in self._categories:
             if not category.enabled:
                 continue
 
@@ -170,26 +179,27 @@ class SourceManager:
         return self._feed_priority_map.get(feed_name, 50)
 
     def get_enabled_feeds(self) -> list[FeedConfig]:
-        """获取所有启用的RSS源，按优先级排序"""
+        """获取所有启用的RSS源，按优先级排序（结果缓存到下次reload）"""
+        if self._enabled_feeds_cache is not None:
+            return list(self._enabled_feeds_cache)
+
         all_feeds: list[FeedConfig] = []
 
-        rss_categories = self.config.sources.get("rss_categories", [])
-        for cat_dict in rss_categories:
-            if not cat_dict.get("enabled", True):
+        for category in self._categories:
+            if not category.enabled:
                 continue
 
-            category = CategoryConfig(**cat_dict)
             for feed in category.feeds:
                 if feed.enabled:
-                    # 继承分类的优先级（如果feed使用默认值）
-                    feed_with_priority = FeedConfig(**feed.model_dump())
-                    if feed_with_priority.priority == 50:
-                        feed_with_priority.priority = category.priority
-                    all_feeds.append(feed_with_priority)
+                    # 继承分类的优先级（如果feed使用默认值），只有此时才复制feed
+                    if feed.priority == 50:
+                        feed = feed.model_copy(update={"priority": category.priority})
+                    all_feeds.append(feed)
 
         # 按优先级降序排序
         all_feeds.sort(key=lambda x: x.priority, reverse=True)
-        return all_feeds
+        self._enabled_feeds_cache = all_feeds
+        return list(all_feeds)
 
     def get_finnhub_priority(self) -> int:
         """获取Finnhub优先级"""
@@ -201,16 +211,16 @@ class SourceManager:
 
     def get_category_min_upvotes(self, category_name: str) -> int | None:
         """获取Reddit分类的最小点赞数要求"""
-        rss_categories = self.config.sources.get("rss_categories", [])
-        for cat_dict in rss_categories:
-            if cat_dict.get("name") == category_name:
-                return cat_dict.get("min_upvotes")
+        for category in self._categories:
+            if category.name == category_name:
+                return category.min_upvotes
         return None
 
     def reload(self) -> None:
         """重新加载配置"""
         logger.info("Reloading source configuration...")
         self._load_config()
+        self._parse_categories()
         self._build_priority_map()
         logger.info("Source configuration reloaded")
 
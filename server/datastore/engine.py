@@ -3,9 +3,15 @@
 使用SQLAlchemy异步引擎连接SQLite数据库
 """
 
-from typing import AsyncGenerator
+import time
+from typing import Any, AsyncGenerator, Callable
 
+from loguru import logger
+from sqlalchemy import Connection, event, inspect, make_url, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
+from sqlalchemy.pool import QueuePool
 
 from server.datastore.models import Base
 from server.settings import global_settings
@@ -14,6 +20,29 @@ from server.settings import global_settings
 engine = None
 AsyncSessionLocal = None
 
+# SQLite忙等待超时（秒），写锁竞争时等待而不是立即报 database is locked
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+# 已编译SQL的缓存条目数（SQLAlchemy默认500），仓储层的热点查询复用编译结果
+QUERY_CACHE_SIZE = 1200
+
+# asyncpg每个连接缓存的prepared statement数量（asyncpg默认100）
+ASYNCPG_STATEMENT_CACHE_SIZE = 1024
+
+# 借出连接数达到pool_size的该比例时告警，同类告警最短间隔（秒）
+POOL_SATURATION_RATIO = 0.8
+POOL_SATURATION_LOG_INTERVAL_SECONDS = 30
+
+# 每个SQLite连接建立时执行的PRAGMA：WAL让读不再被写阻塞，
+# synchronous=NORMAL在WAL下仍保证一致性，只减少fsync次数
+SQLITE_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
 
 async def init_db() -> None:
     """初始化数据库连接和表结构"""
@@ -24,7 +53,19 @@ async def init_db() -> None:
         global_settings.database_url,
         echo=global_settings.database_echo,
         future=True,
+        **_engine_options(global_settings.database_url),
     )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    pool = engine.sync_engine.pool
+    if isinstance(pool, QueuePool):
+        event.listen(engine.sync_engine, "checkout", _pool_saturation_listener(pool))
+
+    # 严格加载模式：任何未声明的懒加载直接报错，防止N+1查询悄悄出现
+    if global_settings.database_strict_loading and not event.contains(
+        Session, "do_orm_execute", _apply_strict_loading
+    ):
+        event.listen(Session, "do_orm_execute", _apply_strict_loading)
 
     # 创建会话工厂
     AsyncSessionLocal = async_sessionmaker(
@@ -36,6 +77,111 @@ async def init_db() -> None:
     # 创建所有表
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_add_missing_indexes)
+
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """根据数据库URL生成连接池参数"""
+    url = make_url(database_url)
+    options: dict[str, Any] = {
+        "pool_pre_ping": True,
+        "query_cache_size": QUERY_CACHE_SIZE,
+    }
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"timeout": SQLITE_BUSY_TIMEOUT_SECONDS}
+        # 内存数据库使用StaticPool（单连接），不支持连接池大小参数
+        if url.database in (None, "", ":memory:"):
+            return options
+    elif url.get_driver_name() == "asyncpg":
+        # 短查询为主，关闭JIT避免编译开销；加大语句缓存复用prepared statement
+        options["connect_args"] = {
+            "server_settings": {"jit": "off"},
+            "statement_cache_size": ASYNCPG_STATEMENT_CACHE_SIZE,
+        }
+
+    options.update(
+        pool_size=global_settings.database_pool_size,
+        max_overflow=global_settings.database_max_overflow,
+        pool_recycle=global_settings.database_pool_recycle_seconds,
+    )
+    return options
+
+
+def _pool_saturation_listener(pool: QueuePool) -> Callable[..., None]:
+    """生成checkout监听器：连接池借出数接近上限时（限频）记录告警"""
+    threshold = POOL_SATURATION_RATIO * pool.size()
+    last_warning = 0.0
+
+    def on_checkout(
+        dbapi_connection: Any, connection_record: Any, connection_proxy: Any
+    ) -> None:
+        nonlocal last_warning
+        checked_out = pool.checkedout()
+        if checked_out < threshold:
+            return
+        now = time.monotonic()
+        if now - last_warning < POOL_SATURATION_LOG_INTERVAL_SECONDS:
+            return
+        last_warning = now
+        logger.warning(
+            f"数据库连接池接近饱和: 借出 {checked_out}/{pool.size()}，溢出 {pool.overflow()}"
+        )
+
+    return on_checkout
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """为新建的SQLite连接设置PRAGMA"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_CONNECT_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _apply_strict_loading(orm_execute_state: ORMExecuteState) -> None:
+    """为ORM查询追加raiseload("*")，需要的关联须显式selectinload"""
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*")
+        )
+
+
+def _add_missing_columns(sync_conn: Connection) -> None:
+    """为已存在的表补齐模型新增的可空列（create_all不会修改已存在的表）"""
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+            )
+
+
+def _add_missing_indexes(sync_conn: Connection) -> None:
+    """为已存在的表补齐模型新增的索引（create_all只在建表时创建索引）"""
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(sync_conn)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -61,6 +207,13 @@ async def close_db() -> None:
         await engine.dispose()
 
 
+def dialect_insert(session: AsyncSession):
+    """获取与当前数据库方言匹配的insert构造器（支持ON CONFLICT）"""
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
 def get_session_factory():
     """获取会话工厂（用于调度器等需要直接创建会话的场景）"""
     if AsyncSessionLocal is None:
@@ -21,6 +21,7 @@ class Migration:
         up_sql: str = "",
         down_sql: str = "",
         depends_on: Optional[List[str]] = None,
+        dialect_up_sql: Optional[Dict[str, str]] = None,
     ):
         self.version = version  # 格式: YYYYMMDD_HHMMSS
         self.name = name
@@ -28,8 +29,14 @@ class Migration:
         self.up_sql = up_sql
         self.down_sql = down_sql
         self.depends_on = depends_on or []
+        # 按数据库方言（如 "postgresql"）覆盖 up_sql
+        self.dialect_up_sql = dialect_up_sql or {}
         self.applied_at: Optional[datetime] = None
 
+    def get_up_sql(self, dialect: str) -> str:
+        """获取指定数据库方言的升级 SQL"""
+        return self.dialect_up_sql.get(dialect, self.up_sql)
+
     def __repr__(self) -> str:
         return f"Migration({self.version}: {self.name})"
 
@@ -134,6 +141,46 @@ class MigrationManager:
                 down_sql="",
                 depends_on=["20240301_000001"],
             ),
+            Migration(
+                version="20261015_000002",
+                name="add_recent_query_indexes",
+                description="Add indexes for recent-news and push-log time window queries",
+                up_sql="""
+                    CREATE INDEX IF NOT EXISTS idx_rss_fetched_at ON rss_articles(fetched_at);
+                    CREATE INDEX IF NOT EXISTS idx_news_push_hash_time ON news_push_log(news_hash, pushed_at);
+                    CREATE INDEX IF NOT EXISTS idx_news_push_platform_time ON news_push_log(platform, pushed_at);
+                """,
+                # PG下带INCLUDE建覆盖索引，与models.py一致；先删除可能已存在的非覆盖版本
+                dialect_up_sql={
+                    "postgresql": """
+                    CREATE INDEX IF NOT EXISTS idx_rss_fetched_at ON rss_articles(fetched_at);
+                    CREATE INDEX IF NOT EXISTS idx_news_push_hash_time ON news_push_log(news_hash, pushed_at);
+                    DROP INDEX IF EXISTS idx_news_push_platform_time;
+                    CREATE INDEX idx_news_push_platform_time ON news_push_log(platform, pushed_at) INCLUDE (news_hash);
+                """
+                },
+                down_sql="""
+                    DROP INDEX IF EXISTS idx_news_push_platform_time;
+                    DROP INDEX IF EXISTS idx_news_push_hash_time;
+                    DROP INDEX IF EXISTS idx_rss_fetched_at;
+                """,
+                depends_on=["20240410_000001"],
+            ),
+            Migration(
+                version="20261015_000003",
+                name="add_alert_claims",
+                description="Add alert_claims table for cross-process alert dedup",
+                up_sql="""
+                    CREATE TABLE IF NOT EXISTS alert_claims (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        claim_key VARCHAR(100) UNIQUE NOT NULL,
+                        claimed_at DATETIME NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS ix_alert_claims_claimed_at ON alert_claims(claimed_at);
+                """,
+                down_sql="DROP TABLE IF EXISTS alert_claims;",
+                depends_on=["20240301_000001"],
+            ),
         ]
 
         # 迁移版本表
@@ -351,8 +398,9 @@ class MigrationManager:
         try:
             async with self._engine.begin() as conn:
                 # 执行迁移 SQL
-                if migration.up_sql:
-                    await conn.execute(migration.up_sql)
+                up_sql = migration.get_up_sql(self._engine.dialect.name)
+                if up_sql:
+                    await conn.execute(up_sql)
 
                 # 记录迁移
                 await conn.execute(
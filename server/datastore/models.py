@@ -30,6 +30,9 @@ class RSSFeedDB(Base):
     url: Mapped[str] = mapped_column(String(1000), nullable=False)
     source: Mapped[str] = mapped_column(String(255), default="")
     last_fetched: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # HTTP条件请求缓存校验值（来自上次响应的ETag / Last-Modified）
+    etag: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(64), nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, nullable=False
@@ -67,6 +70,8 @@ class RSSArticleDB(Base):
     __table_args__ = (
         Index("idx_feed_published", "feed_name", "published"),
         Index("idx_feed_fetched", "feed_name", "fetched_at"),
+        # 最近新闻查询按fetched_at范围过滤并倒序取前N条
+        Index("idx_rss_fetched_at", "fetched_at"),
     )
 
     def __repr__(self) -> str:
@@ -183,6 +188,7 @@ class NewsPushLogDB(Base):
     __tablename__ = "news_push_log"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # 新闻ID（md5前12位hex）或调度器告警键（"namespace:key"，截断到50）
     news_hash: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     push_type: Mapped[str] = mapped_column(
         String(20), default="digest", index=True
@@ -198,12 +204,37 @@ class NewsPushLogDB(Base):
         Index("idx_news_push_hash", "news_hash"),
         Index("idx_news_push_type", "push_type"),
         Index("idx_news_push_platform", "platform"),
+        # has_been_pushed: 按hash查最近推送
+        Index("idx_news_push_hash_time", "news_hash", "pushed_at"),
+        # get_recent_pushed_hashes: 按平台取时间窗口内的hash，PG下可只扫索引
+        Index(
+            "idx_news_push_platform_time",
+            "platform",
+            "pushed_at",
+            postgresql_include=["news_hash"],
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<NewsPushLog(hash={self.news_hash[:8]}..., type={self.push_type}, platform={self.platform})>"
 
 
+class AlertClaimDB(Base):
+    """告警认领表 - 多个调度器进程共享同一数据库时，每条告警只由一个进程推送"""
+
+    __tablename__ = "alert_claims"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # "namespace:key"，过长的key以hash代替（见AlertClaimRepository）
+    claim_key: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    claimed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<AlertClaim(key={self.claim_key}, claimed_at={self.claimed_at})>"
+
+
 class NewsAnalysisCacheDB(Base):
     """LLM分析结果缓存表"""
 
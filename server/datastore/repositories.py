@@ -2,20 +2,38 @@
 数据库Repository层 - 封装数据访问逻辑
 """
 
+import hashlib
+import json
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 
 from loguru import logger
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, func, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import server.datastore.engine as db_engine
 from server.datastore.models import (
+    AlertClaimDB,
     NewsAnalysisCacheDB,
     NewsPushLogDB,
 )
 
+# 流式读取推送记录时每批的行数
+PUSHED_HASHES_YIELD_PER = 500
+# 批量查询推送状态时每条IN语句的hash数量上限
+PUSHED_LOOKUP_BATCH_SIZE = 500
+# 清理推送日志时每个事务删除的行数，避免长事务阻塞并发写入
+CLEANUP_BATCH_SIZE = 10000
+# 告警认领键的最大长度（与AlertClaimDB.claim_key列宽一致）
+ALERT_CLAIM_KEY_MAX_LENGTH = 100
+
 
 class NewsPushLogRepository:
-    """新闻推送日志Repository"""
+    """新闻推送日志Repository
+
+    只读查询都是单表列查询，直接在会话当前连接上以Core方式执行，
+    跳过ORM执行层；写操作仍走会话。
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -25,24 +43,17 @@ class NewsPushLogRepository:
     ) -> bool:
         """检查新闻是否在指定小时内已推送（可指定平台）"""
         cutoff = datetime.utcnow() - timedelta(hours=hours)
+        condition = exists().where(
+            NewsPushLogDB.news_hash == news_hash,
+            NewsPushLogDB.pushed_at >= cutoff,
+        )
         if platform:
             # Filter by platform
-            result = await self.session.execute(
-                select(NewsPushLogDB).where(
-                    NewsPushLogDB.news_hash == news_hash,
-                    NewsPushLogDB.pushed_at >= cutoff,
-                    NewsPushLogDB.platform == platform,
-                )
-            )
-        else:
-            # No platform filter
-            result = await self.session.execute(
-                select(NewsPushLogDB).where(
-                    NewsPushLogDB.news_hash == news_hash,
-                    NewsPushLogDB.pushed_at >= cutoff,
-                )
-            )
-        return result.scalar_one_or_none() is not None
+            condition = condition.where(NewsPushLogDB.platform == platform)
+        # 只判断是否存在，不加载整行（同一新闻可能有多条推送记录）
+        conn = await self.session.connection()
+        result = await conn.execute(select(condition))
+        return bool(result.scalar())
 
     async def mark_pushed(
         self, news_hash: str, push_type: str = "digest", platform: str = ""
@@ -56,19 +67,47 @@ class NewsPushLogRepository:
         )
         self.session.add(log)
 
+    async def mark_pushed_many(
+        self, news_hashes: Sequence[str], push_type: str = "digest", platform: str = ""
+    ) -> None:
+        """批量标记新闻为已推送（一次executemany插入，不创建ORM对象）"""
+        if not news_hashes:
+            return
+        pushed_at = datetime.utcnow()
+        await self.session.execute(
+            insert(NewsPushLogDB),
+            [
+                {
+                    "news_hash": news_hash,
+                    "push_type": push_type,
+                    "platform": platform,
+                    "pushed_at": pushed_at,
+                }
+                for news_hash in news_hashes
+            ],
+        )
+
     async def cleanup_old_logs(self, days: int = 7) -> int:
-        """清理旧的推送日志"""
+        """清理旧的推送日志（调用方负责提交）
+
+        每次最多删除CLEANUP_BATCH_SIZE条，返回值等于该值时可能还有剩余；
+        调用方逐批提交，避免长事务阻塞并发写入。
+        """
         cutoff = datetime.utcnow() - timedelta(days=days)
-        stmt = delete(NewsPushLogDB).where(NewsPushLogDB.pushed_at < cutoff)
-        await self.session.execute(stmt)
-        await self.session.flush()
-        # In SQLAlchemy 2.0, rowcount is accessed from the session
-        # after execution, but type stubs don't reflect this
-        deleted = (
-            getattr(self.session, "rowcount", 0)
-            if hasattr(self.session, "rowcount")
-            else 0
+        expired_ids = (
+            select(NewsPushLogDB.id)
+            .where(NewsPushLogDB.pushed_at < cutoff)
+            .limit(CLEANUP_BATCH_SIZE)
+        )
+        stmt = (
+            delete(NewsPushLogDB)
+            .where(NewsPushLogDB.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
         )
+
+        result = await self.session.execute(stmt)
+        # 删除行数来自execute返回的CursorResult
+        deleted = result.rowcount  # type: ignore[attr-defined]
         if deleted > 0:
             logger.debug(f"Cleaned up {deleted} old push log entries")
         return deleted
@@ -78,42 +117,125 @@ class NewsPushLogRepository:
     ) -> set[str]:
         """获取最近指定小时内已推送的新闻hash集合（可指定平台）"""
         cutoff = datetime.utcnow() - timedelta(hours=hours)
+        stmt = select(NewsPushLogDB.news_hash).where(NewsPushLogDB.pushed_at >= cutoff)
         if platform:
             # Filter by platform
-            result = await self.session.execute(
-                select(NewsPushLogDB.news_hash).where(
-                    NewsPushLogDB.pushed_at >= cutoff,
-                    NewsPushLogDB.platform == platform,
-                )
-            )
-        else:
-            # No platform filter
-            result = await self.session.execute(
-                select(NewsPushLogDB.news_hash).where(
-                    NewsPushLogDB.pushed_at >= cutoff,
-                )
+            stmt = stmt.where(NewsPushLogDB.platform == platform)
+
+        # 流式读取并直接构建集合，避免先物化完整列表
+        conn = await self.session.connection()
+        result = await conn.stream(
+            stmt.execution_options(yield_per=PUSHED_HASHES_YIELD_PER)
+        )
+        return {news_hash async for news_hash in result.scalars()}
+
+    async def get_pushed_among(
+        self, news_hashes: Sequence[str], hours: int = 24, platform: str = ""
+    ) -> set[str]:
+        """批量检查一组hash中哪些在指定小时内已推送（WHERE IN，代替逐条has_been_pushed）"""
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        unique_hashes = list(dict.fromkeys(news_hashes))
+        pushed: set[str] = set()
+        conn = await self.session.connection()
+        for start in range(0, len(unique_hashes), PUSHED_LOOKUP_BATCH_SIZE):
+            batch = unique_hashes[start : start + PUSHED_LOOKUP_BATCH_SIZE]
+            stmt = select(NewsPushLogDB.news_hash).where(
+                NewsPushLogDB.news_hash.in_(batch),
+                NewsPushLogDB.pushed_at >= cutoff,
             )
-        return set(result.scalars().all())
+            if platform:
+                # Filter by platform
+                stmt = stmt.where(NewsPushLogDB.platform == platform)
+            result = await conn.execute(stmt)
+            pushed.update(result.scalars())
+        return pushed
 
     async def get_push_count(self, hours: int = 24, platform: str = "") -> int:
         """获取最近指定小时内的推送数量（可指定平台）"""
         cutoff = datetime.utcnow() - timedelta(hours=hours)
+        stmt = (
+            select(func.count())
+            .select_from(NewsPushLogDB)
+            .where(NewsPushLogDB.pushed_at >= cutoff)
+        )
         if platform:
             # Filter by platform
-            result = await self.session.execute(
-                select(NewsPushLogDB).where(
-                    NewsPushLogDB.pushed_at >= cutoff,
-                    NewsPushLogDB.platform == platform,
-                )
+            stmt = stmt.where(NewsPushLogDB.platform == platform)
+        conn = await self.session.connection()
+        result = await conn.execute(stmt)
+        return result.scalar_one()
+
+
+class AlertClaimRepository:
+    """告警认领Repository
+
+    认领依赖claim_key唯一约束：INSERT ... ON CONFLICT在数据库内原子完成，
+    并发进程对同一告警只有一个能拿到RETURNING结果。
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def claim_key(namespace: str, key: str) -> str:
+        """生成认领键；超长时对key取hash，避免截断导致不同告警撞键"""
+        claim_key = f"{namespace}:{key}"
+        if len(claim_key) <= ALERT_CLAIM_KEY_MAX_LENGTH:
+            return claim_key
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return f"{namespace}:#{digest}"
+
+    async def claim(
+        self, namespace: str, keys: Sequence[str], hours: int = 24
+    ) -> set[str]:
+        """认领一组告警，返回本次认领成功的key（调用方负责提交）
+
+        未被认领过、或上次认领已超过hours小时的告警才能认领成功。
+        """
+        claim_keys = {self.claim_key(namespace, key): key for key in keys}
+        if not claim_keys:
+            return set()
+
+        now = datetime.utcnow()
+        cutoff = now - timedelta(hours=hours)
+        upsert = db_engine.dialect_insert(self.session)
+        claimed: set[str] = set()
+        pending = list(claim_keys)
+        for start in range(0, len(pending), PUSHED_LOOKUP_BATCH_SIZE):
+            batch = pending[start : start + PUSHED_LOOKUP_BATCH_SIZE]
+            stmt = upsert(AlertClaimDB).values(
+                [{"claim_key": claim_key, "claimed_at": now} for claim_key in batch]
             )
-        else:
-            # No platform filter
-            result = await self.session.execute(
-                select(NewsPushLogDB).where(
-                    NewsPushLogDB.pushed_at >= cutoff,
-                )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[AlertClaimDB.claim_key],
+                set_={"claimed_at": stmt.excluded.claimed_at},
+                where=AlertClaimDB.claimed_at < cutoff,
+            ).returning(AlertClaimDB.claim_key)
+            result = await self.session.execute(stmt)
+            claimed.update(claim_keys[claim_key] for claim_key in result.scalars())
+        return claimed
+
+    async def release(self, namespace: str, keys: Sequence[str]) -> None:
+        """释放认领（推送失败时调用，以便下次重试；调用方负责提交）"""
+        claim_keys = [self.claim_key(namespace, key) for key in keys]
+        for start in range(0, len(claim_keys), PUSHED_LOOKUP_BATCH_SIZE):
+            batch = claim_keys[start : start + PUSHED_LOOKUP_BATCH_SIZE]
+            await self.session.execute(
+                delete(AlertClaimDB).where(AlertClaimDB.claim_key.in_(batch))
             )
-        return len(result.scalars().all())
+
+    async def cleanup_expired(self, hours: int = 24) -> int:
+        """清理超过hours小时的认领记录（过期后已可重新认领，保留无意义）"""
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        result = await self.session.execute(
+            delete(AlertClaimDB)
+            .where(AlertClaimDB.claimed_at < cutoff)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = result.rowcount  # type: ignore[attr-defined]
+        if deleted > 0:
+            logger.debug(f"Cleaned up {deleted} expired alert claims")
+        return deleted
 
 
 class NewsAnalysisCacheRepository:
@@ -124,12 +246,14 @@ class NewsAnalysisCacheRepository:
 
     async def get(self, news_hash: str) -> dict | None:
         """获取缓存的LLM分析结果"""
-        import json
-
+        # 每条新闻都会调用，lambda_stmt缓存语句构造，闭包变量作为绑定参数
+        now = datetime.utcnow()
         cache = await self.session.execute(
-            select(NewsAnalysisCacheDB).where(
-                NewsAnalysisCacheDB.news_hash == news_hash,
-                NewsAnalysisCacheDB.expires_at > datetime.utcnow(),
+            lambda_stmt(
+                lambda: select(NewsAnalysisCacheDB).where(
+                    NewsAnalysisCacheDB.news_hash == news_hash,
+                    NewsAnalysisCacheDB.expires_at > now,
+                )
             )
         )
         cached = cache.scalar_one_or_none()
@@ -162,74 +286,51 @@ class NewsAnalysisCacheRepository:
         importance: int,
         ttl_hours: int = 24,
     ) -> None:
-        """缓存LLM分析结果"""
-        import json
+        """缓存LLM分析结果（按news_hash插入或更新，单条UPSERT语句）"""
+        now = datetime.utcnow()
+        values = {
+            "chinese_summary": chinese_summary,
+            "background": background,
+            "market_impact_json": json.dumps(market_impact, ensure_ascii=False),
+            "action": action,
+            "importance": importance,
+            "cached_at": now,
+            "expires_at": now + timedelta(hours=ttl_hours),
+        }
 
-        # 检查是否已存在（更新）
-        existing = await self.session.execute(
-            select(NewsAnalysisCacheDB).where(
-                NewsAnalysisCacheDB.news_hash == news_hash
-            )
+        upsert = db_engine.dialect_insert(self.session)
+        stmt = upsert(NewsAnalysisCacheDB).values(news_hash=news_hash, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NewsAnalysisCacheDB.news_hash],
+            set_={key: stmt.excluded[key] for key in values},
         )
-        cached = existing.scalar_one_or_none()
-
-        market_impact_json = json.dumps(market_impact, ensure_ascii=False)
-        expires_at = datetime.utcnow() + timedelta(hours=ttl_hours)
-
-        if cached:
-            # 更新现有记录
-            cached.chinese_summary = chinese_summary
-            cached.background = background
-            cached.market_impact_json = market_impact_json
-            cached.action = action
-            cached.importance = importance
-            cached.cached_at = datetime.utcnow()
-            cached.expires_at = expires_at
-            logger.debug(f"Updated cache for news hash: {news_hash[:12]}...")
-        else:
-            # 创建新记录
-            cached = NewsAnalysisCacheDB(
-                news_hash=news_hash,
-                chinese_summary=chinese_summary,
-                background=background,
-                market_impact_json=market_impact_json,
-                action=action,
-                importance=importance,
-                cached_at=datetime.utcnow(),
-                expires_at=expires_at,
-            )
-            self.session.add(cached)
-            logger.debug(f"Created cache for news hash: {news_hash[:12]}...")
+        await self.session.execute(stmt)
+        logger.debug(f"Cached analysis for news hash: {news_hash[:12]}...")
 
     async def cleanup_expired(self) -> int:
         """清理过期的缓存"""
-        await self.session.execute(
-            delete(NewsAnalysisCacheDB).where(
-                NewsAnalysisCacheDB.expires_at < datetime.utcnow()
-            )
-        )
-        await self.session.flush()
-        # In SQLAlchemy 2.0, rowcount is accessed from the session
-        deleted = (
-            getattr(self.session, "rowcount", 0)
-            if hasattr(self.session, "rowcount")
-            else 0
+        # 缓存对象不会留在会话中，无需同步identity map
+        result = await self.session.execute(
+            delete(NewsAnalysisCacheDB)
+            .where(NewsAnalysisCacheDB.expires_at < datetime.utcnow())
+            .execution_options(synchronize_session=False)
         )
+        deleted = result.rowcount  # type: ignore[attr-defined]
         if deleted > 0:
             logger.debug(f"Cleaned up {deleted} expired cache entries")
         return deleted
 
     async def get_cache_stats(self) -> dict[str, int]:
         """获取缓存统计信息"""
-        total = await self.session.execute(select(NewsAnalysisCacheDB))
-        total_count = len(total.scalars().all())
-
-        expired = await self.session.execute(
-            select(NewsAnalysisCacheDB).where(
-                NewsAnalysisCacheDB.expires_at < datetime.utcnow()
-            )
+        # 一次查询同时统计总数和过期数（条件聚合），Core方式执行
+        conn = await self.session.connection()
+        result = await conn.execute(
+            select(
+                func.count(),
+                func.count().filter(NewsAnalysisCacheDB.expires_at < datetime.utcnow()),
+            ).select_from(NewsAnalysisCacheDB)
         )
-        expired_count = len(expired.scalars().all())
+        total_count, expired_count = result.one()
 
         return {
             "total_entries": total_count,
@@ -5,34 +5,45 @@ Custom exceptions and error handlers
 from fastapi import HTTPException, status
 
 
-class ValidationError(HTTPException):
-    """Validation error exception"""
+class _StatusHTTPError(HTTPException):
+    """HTTPException with a fixed status code and default detail per subclass"""
+
+    status_code: int
+    default_detail: str
 
-    def __init__(self, detail: str = "Validation error"):
+    def __init__(self, detail: str | None = None):
         super().__init__(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail
+            status_code=type(self).status_code,
+            detail=self.default_detail if detail is None else detail,
         )
 
 
-class NotFoundError(HTTPException):
+class ValidationError(_StatusHTTPError):
+    """Validation error exception"""
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "Validation error"
+
+
+class NotFoundError(_StatusHTTPError):
     """Not found error exception"""
 
-    def __init__(self, detail: str = "Resource not found"):
-        super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    status_code = status.HTTP_404_NOT_FOUND
+    default_detail = "Resource not found"
 
 
-class ConflictError(HTTPException):
+class ConflictError(_StatusHTTPError):
     """Conflict error exception"""
 
-    def __init__(self, detail: str = "Resource conflict"):
-        super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Resource conflict"
 
 
-class UnauthorizedError(HTTPException):
+class UnauthorizedError(_StatusHTTPError):
     """Unauthorized error exception"""
 
-    def __init__(self, detail: str = "Unauthorized"):
-        super().__init__(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
+    status_code = status.HTTP_401_UNAUTHORIZED
+    default_detail = "Unauthorized"
 
 
 class TokenLimitExceeded(Exception):
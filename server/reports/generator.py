@@ -2,39 +2,52 @@
 LLM-powered report generator.
 """
 
-from datetime import datetime
-from typing import Any
+import asyncio
+import hashlib
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, Iterable
 
 from loguru import logger
-from pydantic import BaseModel, Field
 
 from server.ai.llm import LLM
 from server.ai.schema import Message
 from server.analysis.types import CorrelationResults
 from server.reports.templates import ReportTemplate, ReportType, get_template
+from server.services.cache import CacheManager
+from server.services.deduplicator import RequestDeduplicator
 
+# Sampling temperature for report generation
+REPORT_TEMPERATURE = 0.3
+REPORT_CACHE_TTL = timedelta(minutes=30)
+REPORT_CACHE_MAX_SIZE = 64
+# Failed generations are remembered briefly so retries don't hammer a failing provider
+REPORT_FAILURE_TTL = timedelta(seconds=30)
+# Concurrent LLM requests allowed per generator (keeps parallel generate() calls under provider limits)
+MAX_CONCURRENT_LLM_CALLS = 4
 
-class GeneratedReport(BaseModel):
+
+@dataclass(slots=True)
+class GeneratedReport:
     """Generated report output."""
 
     report_type: ReportType
     title: str
     content: str
-    generated_at: datetime = Field(default_factory=datetime.now)
+    generated_at: datetime = field(default_factory=datetime.now)
     token_count: int = 0
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
-class ReportDataContext(BaseModel):
+@dataclass(slots=True)
+class ReportDataContext:
     """Data context for report generation."""
 
-    news_items: list[dict[str, Any]] = Field(default_factory=list)
-    market_data: dict[str, Any] = Field(default_factory=dict)
-    economic_data: dict[str, Any] = Field(default_factory=dict)
+    news_items: list[dict[str, Any]] = field(default_factory=list)
+    market_data: dict[str, Any] = field(default_factory=dict)
+    economic_data: dict[str, Any] = field(default_factory=dict)
     correlation_results: CorrelationResults | None = None
-    fed_news: list[dict[str, Any]] = Field(default_factory=list)
-
-    model_config = {"arbitrary_types_allowed": True}
+    fed_news: list[dict[str, Any]] = field(default_factory=list)
 
 
 class ReportGenerator:
@@ -42,6 +55,28 @@ class ReportGenerator:
 
     def __init__(self, llm: LLM | None = None):
         self.llm = llm or LLM()
+        # Reuses responses for identical prompts; context rarely changes between runs
+        self._cache = CacheManager(
+            prefix="report_",
+            max_size=REPORT_CACHE_MAX_SIZE,
+            default_ttl=REPORT_CACHE_TTL,
+            stale_while_revalidate=False,
+        )
+        self._llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+        # Concurrent generate() calls for the same prompt share one LLM request
+        self._dedup = RequestDeduplicator()
+
+    async def aclose(self) -> None:
+        """Stop the report cache's background cleanup task."""
+        await self._cache.aclose()
+
+    def _cache_key(
+        self, report_type: ReportType, system_prompt: str, user_prompt: str
+    ) -> str:
+        digest = hashlib.sha256(
+            f"{system_prompt}\x00{user_prompt}".encode()
+        ).hexdigest()
+        return f"report_{report_type.value}:{digest}"
 
     # ── Data formatters ──────────────────────────────────────────────────────
 
@@ -54,47 +89,60 @@ class ReportGenerator:
         ]
         return "\n".join(lines)
 
+    @staticmethod
+    def _fmt_section(title: str, rows: Iterable[tuple[Any, str | None, float]]) -> str:
+        """Render (label, formatted value or None, percent change) rows under a title."""
+        lines = [
+            f"- {label}: {pct:+.2f}%"
+            if value is None
+            else f"- {label}: {value} ({pct:+.2f}%)"
+            for label, value, pct in rows
+        ]
+        return "\n".join([f"**{title}:**", *lines])
+
     def _fmt_market(self, data: dict) -> str:
         if not data:
             return "Market data unavailable."
         sections: list[str] = []
 
         if indices := data.get("indices"):
-            lines = ["**Indices:**"]
-            for idx in indices:
-                pct = idx.get("change_percent") or 0
-                sign = "+" if pct >= 0 else ""
-                price = idx.get("price") or 0
-                lines.append(
-                    f"- {idx.get('name', idx.get('symbol'))}: {price:,.2f} ({sign}{pct:.2f}%)"
+            rows = [
+                (
+                    idx.get("name", idx.get("symbol")),
+                    f"{idx.get('price') or 0:,.2f}",
+                    idx.get("change_percent") or 0,
                 )
-            sections.append("\n".join(lines))
+                for idx in indices
+            ]
+            sections.append(self._fmt_section("Indices", rows))
 
         if sectors := data.get("sectors"):
-            lines = ["**Sectors:**"]
-            for s in sectors[:6]:
-                pct = s.get("change_percent") or 0
-                sign = "+" if pct >= 0 else ""
-                lines.append(f"- {s.get('name')}: {sign}{pct:.2f}%")
-            sections.append("\n".join(lines))
+            rows = [
+                (s.get("name"), None, s.get("change_percent") or 0) for s in sectors[:6]
+            ]
+            sections.append(self._fmt_section("Sectors", rows))
 
         if crypto := data.get("crypto"):
-            lines = ["**Crypto:**"]
-            for c in crypto[:5]:
-                price = c.get("current_price") or 0
-                pct = c.get("price_change_percentage_24h") or 0
-                sign = "+" if pct >= 0 else ""
-                lines.append(f"- {c.get('symbol')}: ${price:,.2f} ({sign}{pct:.2f}%)")
-            sections.append("\n".join(lines))
+            rows = [
+                (
+                    c.get("symbol"),
+                    f"${c.get('current_price') or 0:,.2f}",
+                    c.get("price_change_percentage_24h") or 0,
+                )
+                for c in crypto[:5]
+            ]
+            sections.append(self._fmt_section("Crypto", rows))
 
         if commodities := data.get("commodities"):
-            lines = ["**Commodities:**"]
-            for c in commodities:
-                price = c.get("price") or 0
-                pct = c.get("change_percent") or 0
-                sign = "+" if pct >= 0 else ""
-                lines.append(f"- {c.get('name')}: ${price:,.2f} ({sign}{pct:.2f}%)")
-            sections.append("\n".join(lines))
+            rows = [
+                (
+                    c.get("name"),
+                    f"${c.get('price') or 0:,.2f}",
+                    c.get("change_percent") or 0,
+                )
+                for c in commodities
+            ]
+            sections.append(self._fmt_section("Commodities", rows))
 
         return "\n\n".join(sections) if sections else "Market data unavailable."
 
@@ -110,17 +158,14 @@ class ReportGenerator:
         }
         for key, label in labels.items():
             ind = data.get(key)
-            if not ind:
+            if not ind or (value := ind.get("value")) is None:
                 continue
-            value = ind.get("value")
             unit = ind.get("unit", "%")
             change = ind.get("change")
-            if value is not None:
-                line = f"- {label}: {value}{unit}"
-                if change is not None:
-                    sign = "+" if change >= 0 else ""
-                    line += f" ({sign}{change}{unit})"
-                lines.append(line)
+            if change is None:
+                lines.append(f"- {label}: {value}{unit}")
+            else:
+                lines.append(f"- {label}: {value}{unit} ({change:+}{unit})")
         return "\n".join(lines) if lines else "Economic data unavailable."
 
     def _fmt_correlation(self, results: CorrelationResults | None) -> str:
@@ -206,22 +251,20 @@ class ReportGenerator:
     def _fmt_single_indicator(self, ind: dict | None) -> str:
         if not ind:
             return "Data unavailable"
-        value = ind.get("value", "N/A")
-        unit = ind.get("unit", "")
-        change = ind.get("change")
-        result = f"{value}{unit}"
-        if change is not None:
-            sign = "+" if change >= 0 else ""
-            result += f" ({sign}{change}{unit})"
-        return result
+        get = ind.get
+        unit = get("unit", "")
+        change = get("change")
+        if change is None:
+            return f"{get('value', 'N/A')}{unit}"
+        return f"{get('value', 'N/A')}{unit} ({change:+}{unit})"
 
     # ── Prompt builder ───────────────────────────────────────────────────────
 
     def _build_vars(
-        self, report_type: ReportType, ctx: ReportDataContext
+        self, report_type: ReportType, ctx: ReportDataContext, news_count: int
     ) -> dict[str, str]:
         base = {
-            "news_count": str(len(ctx.news_items)),
+            "news_count": str(news_count),
             "news_summary": self._fmt_news(ctx.news_items),
             "market_data": self._fmt_market(ctx.market_data),
             "economic_data": self._fmt_economic(ctx.economic_data),
@@ -281,6 +324,71 @@ class ReportGenerator:
 
     # ── Main generate method ─────────────────────────────────────────────────
 
+    def _prepare(
+        self,
+        report_type: ReportType,
+        context: ReportDataContext,
+        template: ReportTemplate,
+    ) -> "_PreparedReport":
+        """Build the chat messages, response-cache key and metadata for a report."""
+        # Snapshot the context once so the prompt and metadata always agree
+        metadata: dict[str, Any] = {
+            "news_count": len(context.news_items),
+            "has_market_data": bool(context.market_data),
+            "has_correlation": context.correlation_results is not None,
+        }
+        user_prompt = template.render(
+            self._build_vars(report_type, context, news_count=metadata["news_count"])
+        )
+
+        return _PreparedReport(
+            report_type=report_type,
+            template=template,
+            system_msg=Message.system_message(template.system_prompt),
+            user_msg=Message.user_message(user_prompt),
+            cache_key=self._cache_key(report_type, template.system_prompt, user_prompt),
+            metadata=metadata,
+        )
+
+    async def _get_cached(self, prepared: "_PreparedReport") -> GeneratedReport | None:
+        cached = await self._cache.get(prepared.cache_key)
+        if not cached:
+            return None
+        report: GeneratedReport = cached.data
+        logger.info(f"Report cache hit for {prepared.report_type.value}")
+        return replace(
+            report,
+            generated_at=datetime.now(),
+            metadata={**report.metadata, "cache": "exact"},
+        )
+
+    async def _record_failure(
+        self, prepared: "_PreparedReport", error: Exception
+    ) -> GeneratedReport:
+        logger.error(f"Report generation failed: {error}")
+        report = GeneratedReport(
+            report_type=prepared.report_type,
+            title=prepared.template.title,
+            content=f"Report generation failed: {error}",
+            metadata={"error": str(error)},
+        )
+        await self._cache.set(prepared.cache_key, report, ttl=REPORT_FAILURE_TTL)
+        return report
+
+    async def _finish_report(
+        self, prepared: "_PreparedReport", content: str
+    ) -> GeneratedReport:
+        report = GeneratedReport(
+            report_type=prepared.report_type,
+            title=prepared.template.title,
+            content=content,
+            token_count=self.llm.count_tokens(content),
+            metadata=dict(prepared.metadata),
+        )
+        logger.info(f"Report generated: {len(content)} chars")
+        await self._cache.set(prepared.cache_key, report)
+        return report
+
     async def generate(
         self,
         report_type: ReportType,
@@ -289,46 +397,36 @@ class ReportGenerator:
     ) -> GeneratedReport:
         """Generate a report using LLM."""
         template = custom_template or get_template(report_type)
-        vars_ = self._build_vars(report_type, context)
-
-        try:
-            user_prompt = template.user_prompt_template.format(**vars_)
-        except KeyError as e:
-            logger.warning(f"Missing prompt variable {e}, using partial format")
-            user_prompt = template.user_prompt_template
-
-        system_msg = Message.system_message(template.system_prompt)
-        user_msg = Message.user_message(user_prompt)
+        prepared = self._prepare(report_type, context, template)
+        if cached := await self._get_cached(prepared):
+            return cached
 
         logger.info(f"Generating {report_type.value} report...")
 
-        try:
-            content = await self.llm.ask(
-                messages=[user_msg],
-                system_msgs=[system_msg],
-                stream=False,
-                temperature=0.3,
-            )
+        async def ask() -> str:
+            async with self._llm_semaphore:
+                return await self.llm.ask(
+                    messages=[prepared.user_msg],
+                    system_msgs=[prepared.system_msg],
+                    stream=False,
+                    temperature=REPORT_TEMPERATURE,
+                )
 
-            report = GeneratedReport(
-                report_type=report_type,
-                title=template.title,
-                content=content,
-                token_count=self.llm.count_tokens(content),
-                metadata={
-                    "news_count": len(context.news_items),
-                    "has_market_data": bool(context.market_data),
-                    "has_correlation": context.correlation_results is not None,
-                },
-            )
-            logger.info(f"Report generated: {len(content)} chars")
-            return report
+        try:
+            content = await self._dedup.dedupe(prepared.cache_key, ask)
+            return await self._finish_report(prepared, content)
 
         except Exception as e:
-            logger.error(f"Report generation failed: {e}")
-            return GeneratedReport(
-                report_type=report_type,
-                title=template.title,
-                content=f"Report generation failed: {e}",
-                metadata={"error": str(e)},
-            )
+            return await self._record_failure(prepared, e)
+
+
+@dataclass(slots=True)
+class _PreparedReport:
+    """Everything generate() needs for one report once the prompt is built."""
+
+    report_type: ReportType
+    template: ReportTemplate
+    system_msg: Message
+    user_msg: Message
+    cache_key: str
+    metadata: dict[str, Any]
@@ -2,7 +2,13 @@
 Report templates for LLM-powered report generation.
 """
 
+from collections.abc import Mapping
 from enum import Enum
+from functools import lru_cache
+from string import Formatter
+from typing import Any
+
+from loguru import logger
 from pydantic import BaseModel
 
 
@@ -20,6 +26,38 @@ class ReportTemplate(BaseModel):
     user_prompt_template: str
     max_tokens: int = 2000
 
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """Fill user_prompt_template like str.format; missing variables render empty."""
+        parts = []
+        for literal, field, spec, conversion in _compile_prompt(
+            self.user_prompt_template
+        ):
+            parts.append(literal)
+            if field is None:
+                continue
+            try:
+                value, _ = _FORMATTER.get_field(field, (), variables)
+            except (KeyError, AttributeError, IndexError) as e:
+                logger.warning(
+                    f"Missing prompt variable {e} in {self.report_type.value} template"
+                )
+                continue
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, spec or ""))
+        return "".join(parts)
+
+
+_FORMATTER = Formatter()
+
+
+@lru_cache(maxsize=32)
+def _compile_prompt(
+    template: str,
+) -> tuple[tuple[str, str | None, str | None, str | None], ...]:
+    """Parse a prompt template once into (literal, field, spec, conversion) segments."""
+    return tuple(_FORMATTER.parse(template))
+
 
 DAILY_BRIEFING_TEMPLATE = ReportTemplate(
     report_type=ReportType.DAILY_BRIEFING,
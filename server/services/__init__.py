@@ -5,6 +5,7 @@ Provides:
 - CacheManager: Two-tier caching with TTL and stale-while-revalidate
 - CircuitBreaker: Prevents cascading failures
 - RequestDeduplicator: Prevents duplicate concurrent requests
+- AsyncTokenBucket: Paces outgoing requests under a rate limit
 - ServiceClient: Unified client combining all patterns
 """
 
@@ -14,13 +15,14 @@ from server.services.errors import (
     CircuitOpenError,
     RequestTimeoutError,
 )
-from server.services.cache import CacheManager, CacheEntry, CacheResult
+from server.services.cache import CacheManager, CacheEntry, CacheResult, CacheSource
 from server.services.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerRegistry,
     CircuitState,
 )
 from server.services.deduplicator import RequestDeduplicator
+from server.services.rate_limiter import AsyncTokenBucket
 from server.services.client import ServiceClient, RequestResult
 
 __all__ = [
@@ -33,12 +35,15 @@ __all__ = [
     "CacheManager",
     "CacheEntry",
     "CacheResult",
+    "CacheSource",
     # Circuit Breaker
     "CircuitBreaker",
     "CircuitBreakerRegistry",
     "CircuitState",
     # Deduplicator
     "RequestDeduplicator",
+    # Rate limiting
+    "AsyncTokenBucket",
     # Client
     "ServiceClient",
     "RequestResult",
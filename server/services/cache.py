@@ -5,49 +5,66 @@ Features:
 - Memory-based L1 cache with LRU eviction
 - TTL (Time To Live) for cache entries
 - Stale-while-revalidate pattern for better availability
-- Thread-safe async operations
+- Background task that drops fully expired entries
+- Async API without locking: no method awaits while touching the cache, so
+  every operation runs atomically on the event loop
 """
 
 import asyncio
+import contextlib
 import hashlib
+import heapq
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
+from enum import Enum
 from typing import Any, Generic, TypeVar
+from urllib.parse import urlencode
 
 from loguru import logger
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry(Generic[T]):
-    """A single cache entry with metadata."""
+    """A single cache entry with metadata.
+
+    Deadlines are absolute time.monotonic() values; callers read the clock
+    once per operation and pass it in as ``now``.
+    """
 
     data: T
-    timestamp: datetime
-    ttl: timedelta
-    stale_until: datetime
+    expires_at: float
+    stale_until: float
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: float) -> bool:
         """Check if entry is past its TTL."""
-        return datetime.now() > self.timestamp + self.ttl
+        return now > self.expires_at
 
-    def is_stale(self) -> bool:
+    def is_stale(self, now: float) -> bool:
         """Check if entry is stale but still usable."""
-        now = datetime.now()
-        return now > self.timestamp + self.ttl and now <= self.stale_until
+        return self.expires_at < now <= self.stale_until
 
-    def is_valid(self) -> bool:
+    def is_valid(self, now: float) -> bool:
         """Check if entry is still valid (not past stale period)."""
-        return datetime.now() <= self.stale_until
+        return now <= self.stale_until
 
 
-@dataclass
+class CacheSource(str, Enum):
+    """Where a cached value was served from."""
+
+    MEMORY = "memory"
+    STALE = "stale"  # Past TTL, served within the stale-while-revalidate window
+
+
+@dataclass(slots=True)
 class CacheResult(Generic[T]):
     """Result from cache lookup."""
 
     data: T
-    from_cache: str  # 'memory' | 'stale'
+    from_cache: CacheSource
     is_stale: bool
 
 
@@ -76,26 +93,28 @@ class CacheManager:
         stale_while_revalidate: bool = True,
         debug: bool = False,
     ):
-        self._memory: dict[str, CacheEntry[Any]] = {}
+        # Ordered least- to most-recently used
+        self._memory: OrderedDict[str, CacheEntry[Any]] = OrderedDict()
         self._prefix = prefix
         self._max_size = max_size
         self._default_ttl = default_ttl
         self._stale_while_revalidate = stale_while_revalidate
         self._debug = debug
-        self._lock = asyncio.Lock()
         self._stats = CacheStats()
+        # (stale_until, key) min-heap; entries replaced or deleted since are skipped
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._cleanup_task: asyncio.Task[None] | None = None
 
     def generate_key(self, url: str, params: dict[str, Any] | None = None) -> str:
         """Generate a cache key from URL and params."""
         if params:
-            sorted_params = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-            full_key = f"{url}?{sorted_params}"
+            full_key = f"{url}?{urlencode(sorted(params.items()))}"
         else:
             full_key = url
 
-        # Hash long keys
+        # Hash long keys (only needs to be short and stable, not cryptographic)
         if len(full_key) > 200:
-            hash_val = hashlib.md5(full_key.encode()).hexdigest()[:16]
+            hash_val = hashlib.blake2b(full_key.encode(), digest_size=8).hexdigest()
             return f"{self._prefix}{hash_val}"
 
         return f"{self._prefix}{full_key}"
@@ -106,35 +125,36 @@ class CacheManager:
 
         Returns CacheResult if found and valid, None otherwise.
         """
-        async with self._lock:
-            if key not in self._memory:
-                self._stats.misses += 1
-                self._log(f"MISS: {key[:50]}...")
-                return None
-
-            entry = self._memory[key]
-
-            if not entry.is_valid():
-                # Entry is completely expired
-                del self._memory[key]
-                self._stats.misses += 1
-                self._log(f"EXPIRED: {key[:50]}...")
-                return None
-
-            is_stale = entry.is_stale()
-
-            if is_stale:
-                self._stats.stale_hits += 1
-                self._log(f"STALE HIT: {key[:50]}...")
-            else:
-                self._stats.hits += 1
-                self._log(f"HIT: {key[:50]}...")
+        now = time.monotonic()
+        if key not in self._memory:
+            self._stats.misses += 1
+            self._log(f"MISS: {key[:50]}...")
+            return None
+
+        entry = self._memory[key]
+
+        if not entry.is_valid(now):
+            # Entry is completely expired
+            del self._memory[key]
+            self._stats.misses += 1
+            self._log(f"EXPIRED: {key[:50]}...")
+            return None
+
+        self._memory.move_to_end(key)
+        is_stale = entry.is_stale(now)
+
+        if is_stale:
+            self._stats.stale_hits += 1
+            self._log(f"STALE HIT: {key[:50]}...")
+        else:
+            self._stats.hits += 1
+            self._log(f"HIT: {key[:50]}...")
 
-            return CacheResult(
-                data=entry.data,
-                from_cache="memory",
-                is_stale=is_stale,
-            )
+        return CacheResult(
+            data=entry.data,
+            from_cache=CacheSource.STALE if is_stale else CacheSource.MEMORY,
+            is_stale=is_stale,
+        )
 
     async def set(
         self,
@@ -159,32 +179,34 @@ class CacheManager:
             else self._stale_while_revalidate
         )
 
-        now = datetime.now()
-        stale_until = now + ttl * 2 if use_stale else now + ttl
+        now = time.monotonic()
+        ttl_seconds = ttl.total_seconds()
+        expires_at = now + ttl_seconds
+        stale_until = expires_at + ttl_seconds if use_stale else expires_at
 
         entry = CacheEntry(
             data=data,
-            timestamp=now,
-            ttl=ttl,
+            expires_at=expires_at,
             stale_until=stale_until,
         )
 
-        async with self._lock:
-            # LRU eviction if at capacity
-            if len(self._memory) >= self._max_size and key not in self._memory:
-                await self._evict_oldest()
+        # LRU eviction if at capacity
+        if len(self._memory) >= self._max_size and key not in self._memory:
+            self._evict_oldest()
 
-            self._memory[key] = entry
-            self._log(f"SET: {key[:50]}... (TTL: {ttl.total_seconds()}s)")
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (stale_until, key))
+        self._ensure_cleanup_task()
+        self._log(f"SET: {key[:50]}... (TTL: {ttl.total_seconds()}s)")
 
     async def delete(self, key: str) -> bool:
         """Delete a specific key from cache."""
-        async with self._lock:
-            if key in self._memory:
-                del self._memory[key]
-                self._log(f"DELETE: {key[:50]}...")
-                return True
-            return False
+        if key in self._memory:
+            del self._memory[key]
+            self._log(f"DELETE: {key[:50]}...")
+            return True
+        return False
 
     async def invalidate(self, pattern: str) -> int:
         """
@@ -196,48 +218,69 @@ class CacheManager:
         Returns:
             Number of entries invalidated
         """
-        async with self._lock:
-            keys_to_delete = [k for k in self._memory if pattern in k]
-            for key in keys_to_delete:
-                del self._memory[key]
+        keys_to_delete = [k for k in self._memory if pattern in k]
+        for key in keys_to_delete:
+            del self._memory[key]
 
-            if keys_to_delete:
-                self._log(
-                    f"INVALIDATE: {len(keys_to_delete)} entries matching '{pattern}'"
-                )
+        if keys_to_delete:
+            self._log(f"INVALIDATE: {len(keys_to_delete)} entries matching '{pattern}'")
 
-            return len(keys_to_delete)
+        return len(keys_to_delete)
 
     async def clear(self) -> None:
         """Clear all cache entries."""
-        async with self._lock:
-            count = len(self._memory)
-            self._memory.clear()
-            self._log(f"CLEAR: {count} entries removed")
+        count = len(self._memory)
+        self._memory.clear()
+        self._expiry_heap.clear()
+        self._log(f"CLEAR: {count} entries removed")
 
     async def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count of removed entries."""
-        async with self._lock:
-            expired_keys = [k for k, v in self._memory.items() if not v.is_valid()]
-            for key in expired_keys:
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            entry = self._memory.get(key)
+            if entry is not None and not entry.is_valid(now):
                 del self._memory[key]
-
-            if expired_keys:
-                self._log(f"CLEANUP: {len(expired_keys)} expired entries removed")
-
-            return len(expired_keys)
-
-    async def _evict_oldest(self) -> None:
-        """Evict the oldest entry (LRU)."""
+                removed += 1
+
+        # Re-set keys leave superseded heap items behind; rebuild when they dominate
+        if len(heap) > 2 * max(len(self._memory), self._max_size):
+            self._expiry_heap = [(v.stale_until, k) for k, v in self._memory.items()]
+            heapq.heapify(self._expiry_heap)
+
+        if removed:
+            self._log(f"CLEANUP: {removed} expired entries removed")
+
+        return removed
+
+    async def aclose(self) -> None:
+        """Stop the background cleanup task."""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._cleanup_task
+            self._cleanup_task = None
+
+    def _ensure_cleanup_task(self) -> None:
+        """Start the cleanup loop on the running event loop if it isn't running."""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def _cleanup_loop(self) -> None:
+        interval = max(self._default_ttl.total_seconds() / 2, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            await self.cleanup_expired()
+
+    def _evict_oldest(self) -> None:
+        """Evict the least recently used entry."""
         if not self._memory:
             return
 
-        # Find oldest by timestamp
-        oldest_key = min(
-            self._memory.keys(),
-            key=lambda k: self._memory[k].timestamp,
-        )
-        del self._memory[oldest_key]
+        oldest_key, _ = self._memory.popitem(last=False)
         self._stats.evictions += 1
         self._log(f"EVICT: {oldest_key[:50]}...")
 
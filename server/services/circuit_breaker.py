@@ -11,13 +11,16 @@ Transitions:
 - OPEN → HALF_OPEN: After reset_timeout expires
 - HALF_OPEN → CLOSED: On successful request
 - HALF_OPEN → OPEN: On failed request
+
+All methods are synchronous, so each check-and-transition runs atomically on
+the event loop without a lock.
 """
 
-import asyncio
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 from loguru import logger
 
@@ -38,6 +41,7 @@ class CircuitBreakerConfig:
     reset_timeout: timedelta = timedelta(seconds=30)  # Time before half-open
     half_open_max_requests: int = 1  # Requests allowed in half-open state
     success_threshold: int = 1  # Successes needed to close from half-open
+    now_ns: Callable[[], int] = time.monotonic_ns  # Clock for timeouts (injectable)
 
 
 class CircuitBreaker:
@@ -70,20 +74,19 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
-        self._last_failure_time: datetime | None = None
-        self._opened_at: datetime | None = None
+        self._reset_timeout_ns = int(self.config.reset_timeout.total_seconds() * 1e9)
+        # Monotonic timestamps (0 = unset); wall-clock times are derived in get_status()
+        self._last_failure_ns = 0
+        self._opened_at_ns = 0
         self._half_open_requests = 0
-        self._lock = asyncio.Lock()
+        self._last_probe_ns = 0
 
     @property
     def state(self) -> CircuitState:
         """Get current state, checking for automatic transitions."""
         if self._state == CircuitState.OPEN:
             # Check if we should transition to half-open
-            if (
-                self._opened_at
-                and datetime.now() >= self._opened_at + self.config.reset_timeout
-            ):
+            if self.config.now_ns() - self._opened_at_ns >= self._reset_timeout_ns:
                 self._state = CircuitState.HALF_OPEN
                 self._half_open_requests = 0
                 self._success_count = 0
@@ -102,9 +105,22 @@ class CircuitBreaker:
         if current_state == CircuitState.OPEN:
             return False
 
-        # HALF_OPEN: Allow limited requests
+        # HALF_OPEN: Allow limited requests (count the probe as it is admitted)
         if current_state == CircuitState.HALF_OPEN:
-            return self._half_open_requests < self.config.half_open_max_requests
+            now = self.config.now_ns()
+            if self._half_open_requests >= self.config.half_open_max_requests:
+                # Probes that never reported back (e.g. cancelled) expire after
+                # reset_timeout so their slots can't wedge the breaker
+                if now - self._last_probe_ns < self._reset_timeout_ns:
+                    return False
+                logger.warning(
+                    f"Circuit breaker '{self.service_id}' half-open probe timed out, "
+                    "allowing a new probe"
+                )
+                self._half_open_requests = 0
+            self._half_open_requests += 1
+            self._last_probe_ns = now
+            return True
 
         return False
 
@@ -114,6 +130,9 @@ class CircuitBreaker:
             self._success_count += 1
             if self._success_count >= self.config.success_threshold:
                 self._close()
+            else:
+                # Probe finished; free its slot for the next one
+                self._half_open_requests = max(0, self._half_open_requests - 1)
         elif self._state == CircuitState.CLOSED:
             # Reset failure count on success
             self._failure_count = 0
@@ -121,7 +140,7 @@ class CircuitBreaker:
     def record_failure(self) -> None:
         """Record a failed request."""
         self._failure_count += 1
-        self._last_failure_time = datetime.now()
+        self._last_failure_ns = self.config.now_ns()
 
         if self._state == CircuitState.HALF_OPEN:
             # Any failure in half-open reopens the circuit
@@ -133,7 +152,7 @@ class CircuitBreaker:
     def _open(self) -> None:
         """Transition to OPEN state."""
         self._state = CircuitState.OPEN
-        self._opened_at = datetime.now()
+        self._opened_at_ns = self.config.now_ns()
         logger.warning(
             f"Circuit breaker '{self.service_id}' OPENED after {self._failure_count} failures"
         )
@@ -143,7 +162,7 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
-        self._opened_at = None
+        self._opened_at_ns = 0
         self._half_open_requests = 0
         logger.info(f"Circuit breaker '{self.service_id}' CLOSED (recovered)")
 
@@ -152,19 +171,25 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
-        self._opened_at = None
+        self._opened_at_ns = 0
         self._half_open_requests = 0
-        self._last_failure_time = None
+        self._last_failure_ns = 0
         logger.info(f"Circuit breaker '{self.service_id}' manually reset")
 
     def get_time_until_reset(self) -> float | None:
         """Get seconds until circuit transitions to half-open."""
-        if self._state != CircuitState.OPEN or not self._opened_at:
+        if self._state != CircuitState.OPEN:
             return None
 
-        reset_at = self._opened_at + self.config.reset_timeout
-        remaining = (reset_at - datetime.now()).total_seconds()
-        return max(0, remaining)
+        elapsed_ns = self.config.now_ns() - self._opened_at_ns
+        return max(0, (self._reset_timeout_ns - elapsed_ns) / 1e9)
+
+    def _to_isoformat(self, ns: int) -> str | None:
+        """Convert a monotonic timestamp from now_ns() to a wall-clock ISO string."""
+        if not ns:
+            return None
+        elapsed = timedelta(microseconds=(self.config.now_ns() - ns) / 1000)
+        return (datetime.now() - elapsed).isoformat()
 
     def get_status(self) -> dict[str, Any]:
         """Get current status as dictionary."""
@@ -173,10 +198,12 @@ class CircuitBreaker:
             "state": self.state.value,
             "failure_count": self._failure_count,
             "success_count": self._success_count,
-            "last_failure": (
-                self._last_failure_time.isoformat() if self._last_failure_time else None
+            "last_failure": self._to_isoformat(self._last_failure_ns),
+            "opened_at": (
+                self._to_isoformat(self._opened_at_ns)
+                if self._state != CircuitState.CLOSED
+                else None
             ),
-            "opened_at": (self._opened_at.isoformat() if self._opened_at else None),
             "time_until_reset": self.get_time_until_reset(),
         }
 
@@ -193,7 +220,6 @@ class CircuitBreakerRegistry:
     def __init__(self, default_config: CircuitBreakerConfig | None = None):
         self._breakers: dict[str, CircuitBreaker] = {}
         self._default_config = default_config or CircuitBreakerConfig()
-        self._lock = asyncio.Lock()
 
     def get(
         self,
@@ -14,7 +14,7 @@ from typing import Any, Generic, TypeVar
 import httpx
 from loguru import logger
 
-from server.services.cache import CacheManager
+from server.services.cache import CacheManager, CacheSource
 from server.services.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerRegistry,
@@ -30,7 +30,7 @@ class RequestResult(Generic[T]):
     """Result from a service request."""
 
     data: T
-    from_cache: str | None = None  # 'memory' | 'stale' | None
+    from_cache: CacheSource | None = None
     is_stale: bool = False
     service_id: str | None = None
 
@@ -204,7 +204,7 @@ class ServiceClient:
                     )
                     return RequestResult(
                         data=stale_data,
-                        from_cache="stale",
+                        from_cache=CacheSource.STALE,
                         is_stale=True,
                         service_id=service_id,
                     )
@@ -258,7 +258,7 @@ class ServiceClient:
                 )
                 return RequestResult(
                     data=stale_data,
-                    from_cache="stale",
+                    from_cache=CacheSource.STALE,
                     is_stale=True,
                     service_id=service_id,
                 )
@@ -309,6 +309,7 @@ class ServiceClient:
             self._http_client = None
 
         await self._deduplicator.cancel_all()
+        await self._cache.aclose()
         logger.debug("ServiceClient closed")
 
     async def __aenter__(self) -> "ServiceClient":
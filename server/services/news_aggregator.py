@@ -10,9 +10,24 @@ from typing import TYPE_CHECKING
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from server.utils import BoundedSet
+
 if TYPE_CHECKING:
     from server.datasource.source_manager import SourceManager
 
+# Max title hashes remembered for cross-run deduplication
+SEEN_HASHES_LIMIT = 10000
+
+
+def published_sort_key(article: dict) -> float:
+    """Sort key for raw article dicts: POSIX timestamp of ``published``, 0 if unset.
+
+    Comparing floats is cheaper than comparing datetimes, and the key is
+    computed once per article rather than per comparison.
+    """
+    published = article.get("published")
+    return published.timestamp() if published else 0.0
+
 
 class NewsItem(BaseModel):
     """Aggregated news item with analysis."""
@@ -153,7 +168,8 @@ class NewsAggregator:
         source_manager: "SourceManager | None" = None,
     ):
         self.similarity_threshold = similarity_threshold
-        self._seen_hashes: set[str] = set()
+        # Oldest hashes are evicted first once the limit is reached
+        self._seen_hashes = BoundedSet(SEEN_HASHES_LIMIT)
         self._source_manager = source_manager
 
     def _normalize_text(self, text: str) -> str:
@@ -237,7 +253,7 @@ class NewsAggregator:
                 except (ValueError, TypeError):
                     pass
 
-        recent.sort(key=lambda x: x.get("published", datetime.min), reverse=True)
+        recent.sort(key=published_sort_key, reverse=True)
         logger.info(f"[聚合] 时间窗口过滤后剩余 {len(recent)} 条文章")
 
         # Group similar articles
@@ -333,13 +349,6 @@ class NewsAggregator:
                 f"[聚合] 因 seen_hash 跳过了 {skipped_by_hash} 条重复新闻（缓存大小：{len(self._seen_hashes)}）"
             )
 
-        # Limit seen hashes to prevent memory growth
-        if len(self._seen_hashes) > 10000:
-            self._seen_hashes = set(list(self._seen_hashes)[-5000:])
-            logger.info(
-                f"[聚合] seen_hash 缓存已清理，当前大小 {len(self._seen_hashes)}"
-            )
-
         # Sort by source priority and published time
         result.sort(key=lambda x: (x.source_priority, x.published), reverse=True)
 
@@ -2,16 +2,25 @@
 统一的新闻处理服务 - 整合获取、过滤、分析、推送
 """
 
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 
 from loguru import logger
+from sqlalchemy import select
 
+from server.datastore.models import RSSArticleDB
 from server.datastore.repositories import (
+    CLEANUP_BATCH_SIZE,
     NewsAnalysisCacheRepository,
     NewsPushLogRepository,
 )
 from server.datasource.source_manager import SourceManager
-from server.services.news_aggregator import NewsAggregator, NewsAnalyzer, NewsItem
+from server.services.news_aggregator import (
+    NewsAggregator,
+    NewsAnalyzer,
+    NewsItem,
+    published_sort_key,
+)
 
 
 class NewsProcessor:
@@ -41,6 +50,7 @@ class NewsProcessor:
         platform: str = "",
         fetch_start_time: datetime | None = None,
         offset: int = 0,
+        min_importance: int | None = None,
     ) -> list[NewsItem]:
         """
         获取和处理新闻的统一入口
@@ -54,31 +64,33 @@ class NewsProcessor:
             platform: 推送平台（用于按平台去重，如 "feishu", "telegram"）
             fetch_start_time: 指定获取新闻的起始时间（用于继续推送功能）
             offset: 分页偏移量（用于 /continue 翻页）
+            min_importance: 只返回重要性不低于该值的新闻（未指定时按默认规则排序）
         """
-        # Step 1: 获取原始新闻
-        news_items = await self._fetch_recent_news(
-            hours=hours, fetch_start_time=fetch_start_time
-        )
+        # Step 1-3 只读数据库，共用一个会话；LLM分析前释放连接
+        async with self._read_session() as session:
+            # Step 1: 获取原始新闻
+            news_items = await self._fetch_recent_news(
+                hours=hours, fetch_start_time=fetch_start_time, session=session
+            )
 
-        if not news_items:
-            return []
+            if not news_items:
+                return []
 
-        # Step 2: 聚合去重（带源优先级排序）
-        aggregated = self.news_aggregator.aggregate(
-            news_items,
-            time_window_minutes=int(hours * 60),
-            source_manager=self.source_manager,
-        )
+            # Step 2: 聚合去重（带源优先级排序）
+            aggregated = self.news_aggregator.aggregate(
+                news_items,
+                time_window_minutes=int(hours * 60),
+                source_manager=self.source_manager,
+            )
 
-        if not aggregated:
-            return []
+            if not aggregated:
+                return []
 
-        # Step 3: 过滤已推送（如果需要）
-        if filter_pushed and self.session_factory:
-            async with self.session_factory() as session:
+            # Step 3: 过滤已推送（如果需要）
+            if filter_pushed and session is not None:
                 push_repo = NewsPushLogRepository(session)
-                recent_pushed = await push_repo.get_recent_pushed_hashes(
-                    hours=24, platform=platform
+                recent_pushed = await push_repo.get_pushed_among(
+                    [item.id for item in aggregated], hours=24, platform=platform
                 )
 
                 filtered = [item for item in aggregated if item.id not in recent_pushed]
@@ -99,7 +111,15 @@ class NewsProcessor:
             )
 
         # Step 5: 按重要性或源优先级排序
-        if any(item.importance >= 2 for item in aggregated):
+        if min_importance is not None:
+            # 调用方指定了重要性门槛（如简报），未达标的新闻直接丢弃
+            aggregated = sorted(
+                [i for i in aggregated if i.importance >= min_importance],
+                key=lambda x: x.importance,
+                reverse=True,
+            )
+            logger.info(f"[排序] 重要性>={min_importance}的新闻: {len(aggregated)} 条")
+        elif any(item.importance >= 2 for item in aggregated):
             # 有重要性评分，按重要性排序
             aggregated = sorted(
                 [i for i in aggregated if i.importance >= 2],
@@ -129,18 +149,31 @@ class NewsProcessor:
 
         async with self.session_factory() as session:
             push_repo = NewsPushLogRepository(session)
-            for item in items:
-                await push_repo.mark_pushed(item.id, push_type, platform)
+            await push_repo.mark_pushed_many(
+                [item.id for item in items], push_type, platform
+            )
 
             await session.commit()
 
-            # 定期清理旧日志
-            deleted = await push_repo.cleanup_old_logs(days=7)
+            # 定期清理旧日志（分批删除、逐批提交）
+            deleted = 0
+            while True:
+                batch_deleted = await push_repo.cleanup_old_logs(days=7)
+                await session.commit()
+                deleted += batch_deleted
+                if batch_deleted < CLEANUP_BATCH_SIZE:
+                    break
             if deleted > 0:
                 logger.info(f"[推送日志] 清理旧记录 {deleted} 条")
 
+    def _read_session(self):
+        """打开一个只读会话（无数据库时返回None）"""
+        if self.session_factory:
+            return self.session_factory()
+        return nullcontext()
+
     async def _fetch_recent_news(
-        self, hours: float, fetch_start_time: datetime | None = None
+        self, hours: float, fetch_start_time: datetime | None = None, session=None
     ) -> list[dict]:
         """获取最近的新闻（复用scheduler逻辑）
 
@@ -148,6 +181,7 @@ class NewsProcessor:
             hours: 获取最近多少小时的新闻
             fetch_start_time: 指定获取新闻的起始时间（用于继续推送功能）
                            如果为 None，则获取 30 分钟前的新闻（第一次获取）
+            session: 调用方已打开的数据库会话
         """
         import time
 
@@ -175,36 +209,32 @@ class NewsProcessor:
         finnhub_count = 0
 
         # Get RSS articles from database
-        if self.session_factory:
+        if session is not None:
             try:
-                from sqlalchemy import select
-                from server.datastore.models import RSSArticleDB
-
                 rss_start = time.time()
                 # Use the determined cutoff time
-                async with self.session_factory() as session:
-                    query = (
-                        select(RSSArticleDB)
-                        .where(RSSArticleDB.fetched_at >= cutoff)
-                        .order_by(RSSArticleDB.fetched_at.desc())
-                        .limit(200)
+                query = (
+                    select(RSSArticleDB)
+                    .where(RSSArticleDB.fetched_at >= cutoff)
+                    .order_by(RSSArticleDB.fetched_at.desc())
+                    .limit(200)
+                )
+                result = await session.execute(query)
+                articles = result.scalars().all()
+
+                for a in articles:
+                    news_items.append(
+                        {
+                            "title": a.title,
+                            "source": a.feed_name,
+                            "source_type": "rss",
+                            "published": a.published,
+                            "summary": a.summary,
+                            "link": a.link,
+                            "category": a.category,
+                        }
                     )
-                    result = await session.execute(query)
-                    articles = result.scalars().all()
-
-                    for a in articles:
-                        news_items.append(
-                            {
-                                "title": a.title,
-                                "source": a.feed_name,
-                                "source_type": "rss",
-                                "published": a.published,
-                                "summary": a.summary,
-                                "link": a.link,
-                                "category": a.category,
-                            }
-                        )
-                    rss_count = len(articles)
+                rss_count = len(articles)
 
                 rss_elapsed = time.time() - rss_start
                 logger.info(
@@ -213,6 +243,8 @@ class NewsProcessor:
 
             except Exception as e:
                 logger.error(f"Failed to get RSS news: {e}")
+                # 会话由调用方继续使用，回滚失败的事务
+                await session.rollback()
 
         # Get Finnhub news from scheduler cache
         if self.scheduler and hasattr(self.scheduler, "_latest_finnhub_news"):
@@ -231,9 +263,7 @@ class NewsProcessor:
                             "related_symbols": fn.related_symbols,
                         }
                     )
-            finnhub_count = len(
-                [n for n in news_items if n.get("source_type") == "finnhub"]
-            )
+                    finnhub_count += 1
 
             finnhub_elapsed = time.time() - finnhub_start
             logger.info(
@@ -241,7 +271,7 @@ class NewsProcessor:
             )
 
         # Sort by published date
-        news_items.sort(key=lambda x: x.get("published", datetime.min), reverse=True)
+        news_items.sort(key=published_sort_key, reverse=True)
 
         total_elapsed = time.time() - start_time
         logger.info(
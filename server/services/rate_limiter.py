@@ -0,0 +1,55 @@
+"""
+AsyncTokenBucket - Paces outgoing requests to stay under a rate limit.
+
+Tokens refill continuously at ``rate`` per second up to ``capacity``.
+Each request takes one token; when the bucket is empty the caller waits
+until enough tokens have refilled instead of hitting the remote limit
+and being throttled (e.g. Telegram 429 with retry_after).
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket rate limiter for async callers.
+
+    Usage:
+        bucket = AsyncTokenBucket(rate=1.0, capacity=5)
+
+        await bucket.acquire()
+        await send_message(...)
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available, then take them."""
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (without waiting)."""
+        self._refill()
+        return self._tokens
@@ -21,6 +21,7 @@ async def load_watchlist(session_factory) -> list[str]:
             if items:
                 symbols = [item.symbol for item in items]
                 global_settings.watchlist_symbols = symbols
+                global_settings.invalidate_watchlist_cache()
                 logger.info(f"Loaded {len(symbols)} watchlist symbols from DB")
                 return symbols
             else:
@@ -69,6 +70,7 @@ async def add_watch(
         # Sync to in-memory settings for stock type
         if watch_type == "stock" and symbol not in global_settings.watchlist_symbols:
             global_settings.watchlist_symbols.append(symbol)
+            global_settings.invalidate_watchlist_cache()
 
         return True
     except Exception as e:
@@ -89,6 +91,7 @@ async def remove_watch(session_factory, symbol: str) -> bool:
         # Sync to in-memory settings
         if symbol in global_settings.watchlist_symbols:
             global_settings.watchlist_symbols.remove(symbol)
+            global_settings.invalidate_watchlist_cache()
 
         return removed
     except Exception as e:
@@ -3,7 +3,7 @@ Application settings with support for new data sources and services.
 """
 
 from dotenv import load_dotenv
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 load_dotenv()
@@ -67,6 +67,14 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./xbot.db", alias="DATABASE_URL"
     )
     database_echo: bool = Field(default=False, alias="DATABASE_ECHO")
+    database_pool_size: int = Field(default=10, alias="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=20, alias="DATABASE_MAX_OVERFLOW")
+    database_pool_recycle_seconds: int = Field(
+        default=1800, alias="DATABASE_POOL_RECYCLE"
+    )
+    database_strict_loading: bool = Field(
+        default=False, alias="DATABASE_STRICT_LOADING"
+    )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # LLM Configuration
@@ -173,6 +181,9 @@ class Settings(BaseSettings):
     push_news_burst_window_minutes: int = Field(
         default=30, alias="PUSH_NEWS_BURST_WINDOW"
     )
+    push_dedup_state_path: str = Field(
+        default="./xbot_push_dedup.bin", alias="PUSH_DEDUP_STATE_PATH"
+    )
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Watchlist Configuration
@@ -180,6 +191,18 @@ class Settings(BaseSettings):
     watchlist_symbols: list[str] = Field(
         default=["NVDA", "AAPL", "MSFT", "GOOGL", "TSLA"], alias="WATCHLIST_SYMBOLS"
     )
+    _watchlist_symbols_set: frozenset[str] | None = PrivateAttr(default=None)
+
+    @property
+    def watchlist_symbols_set(self) -> frozenset[str]:
+        """Watchlist as a frozenset for membership checks (cached)."""
+        if self._watchlist_symbols_set is None:
+            self._watchlist_symbols_set = frozenset(self.watchlist_symbols or ())
+        return self._watchlist_symbols_set
+
+    def invalidate_watchlist_cache(self) -> None:
+        """Drop the cached watchlist set after watchlist_symbols changes."""
+        self._watchlist_symbols_set = None
 
     # ═══════════════════════════════════════════════════════════════════════════
     # Logging Configuration
@@ -1,5 +1,10 @@
 import functools
+import hashlib
 import inspect
+import math
+import struct
+from collections import deque
+from collections.abc import Iterator
 
 from loguru import logger
 
@@ -41,3 +46,124 @@ def safe_func_wrapper(func):
             raise RuntimeError(f"Exception: {type(e).__name__}: {e}")
 
     return wrapper
+
+
+class BoundedSet:
+    """
+    A set of string IDs that keeps at most ``maxlen`` entries.
+
+    Membership checks use a plain set; insertion order is tracked in a deque
+    so that evicting the oldest entry on overflow is O(1).
+    """
+
+    __slots__ = ("maxlen", "_items", "_order")
+
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen = maxlen
+        self._items: set[str] = set()
+        self._order: deque[str] = deque()
+
+    def add(self, item: str) -> None:
+        """Add an item, evicting the oldest one if the set is full."""
+        if item in self._items:
+            return
+        if len(self._order) >= self.maxlen:
+            self._items.discard(self._order.popleft())
+        self._order.append(item)
+        self._items.add(item)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._items.clear()
+        self._order.clear()
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter over string keys that can be saved to disk.
+
+    Sized for ``capacity`` keys at roughly ``error_rate`` false positives. The
+    k bit positions are derived from one blake2b digest by double hashing, so
+    membership and insertion cost a single hash regardless of k.
+    """
+
+    __slots__ = ("capacity", "num_bits", "num_hashes", "count", "_bits")
+
+    _HEADER = struct.Struct("<III")  # num_bits, num_hashes, count
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = capacity
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, key: str) -> None:
+        """Add a key; ``count`` only grows when at least one new bit is set."""
+        bits = self._bits
+        added = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+
+    def clear(self) -> None:
+        """Reset all bits."""
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the filter holds ``capacity`` keys and exceeds its error rate."""
+        return self.count >= self.capacity
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter (header followed by the raw bit array)."""
+        header = self._HEADER.pack(self.num_bits, self.num_hashes, self.count)
+        return header + bytes(self._bits)
+
+    def load_bytes(self, data: bytes) -> bool:
+        """
+        Restore state written by ``to_bytes``.
+
+        Returns False and leaves the filter untouched if the data was written
+        by a filter of a different size.
+        """
+        header_size = self._HEADER.size
+        if len(data) != header_size + len(self._bits):
+            return False
+        num_bits, num_hashes, count = self._HEADER.unpack_from(data)
+        if num_bits != self.num_bits or num_hashes != self.num_hashes:
+            return False
+        self._bits = bytearray(data[header_size:])
+        self.count = count
+        return True
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count